@@ -0,0 +1,306 @@
+// Compression throughput benchmark of the compression libraries of conan-center-index.
+// Usage: compression_benchmark <results.json> [corpus size in bytes]
+
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <functional>
+#include <string>
+#include <vector>
+
+#include <blosc.h>
+#include <brotli/decode.h>
+#include <brotli/encode.h>
+#include <bzlib.h>
+#include <lz4.h>
+#include <lz4hc.h>
+#include <lzma.h>
+#include <lzo/lzo1x.h>
+#include <snappy.h>
+#include <zlib.h>
+#include <zstd.h>
+
+namespace {
+
+typedef std::vector<unsigned char> Buffer;
+
+// Returns the compressed size, or 0 on error
+typedef std::function<size_t(int level, const Buffer& src, Buffer& dst)> CompressFunction;
+// Returns the decompressed size, or 0 on error
+typedef std::function<size_t(const Buffer& src, size_t src_size, Buffer& dst)> DecompressFunction;
+
+struct Codec {
+    std::string name;
+    std::string package;
+    std::vector<int> levels;
+    size_t (*bound)(size_t);
+    CompressFunction compress;
+    DecompressFunction decompress;
+};
+
+struct Result {
+    std::string codec;
+    std::string package;
+    int level;
+    size_t compressed_size;
+    double compress_mb_s;
+    double decompress_mb_s;
+};
+
+// Deterministic corpus mixing text, a column of slowly changing integers and pseudo random bytes
+Buffer make_corpus(size_t size)
+{
+    static const char* const words[] = {"conan ", "center ", "index ", "package ", "recipe ", "compression ", "benchmark ", "\n"};
+    Buffer corpus;
+    corpus.reserve(size);
+    unsigned long state = 12345;
+    unsigned int counter = 0;
+    while (corpus.size() < size) {
+        state = state * 1103515245UL + 12345UL;
+        const unsigned int kind = (state >> 16) % 16;
+        if (kind < 10) {
+            for (const char* word = words[(state >> 20) % 8]; *word; ++word) {
+                corpus.push_back(static_cast<unsigned char>(*word));
+            }
+        } else if (kind < 14) {
+            counter += (state >> 24) % 4;
+            for (int i = 0; i < 4; ++i) {
+                corpus.push_back(static_cast<unsigned char>(counter >> (8 * i)));
+            }
+        } else {
+            for (int i = 0; i < 8; ++i) {
+                state = state * 1103515245UL + 12345UL;
+                corpus.push_back(static_cast<unsigned char>(state >> 16));
+            }
+        }
+    }
+    corpus.resize(size);
+    return corpus;
+}
+
+template <typename F>
+double best_seconds(int repeat, F&& f)
+{
+    double best = 0.;
+    for (int i = 0; i < repeat; ++i) {
+        const auto start = std::chrono::steady_clock::now();
+        f();
+        const double duration = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+        if (i == 0 || duration < best) {
+            best = duration;
+        }
+    }
+    return best;
+}
+
+double mb_per_s(size_t bytes, double duration)
+{
+    return duration > 0. ? bytes / (1024. * 1024.) / duration : 0.;
+}
+
+std::vector<Codec> make_codecs()
+{
+    std::vector<Codec> codecs;
+
+    codecs.push_back({"zlib", "zlib", {1, 6, 9},
+        [](size_t n) { return static_cast<size_t>(compressBound(static_cast<uLong>(n))); },
+        [](int level, const Buffer& src, Buffer& dst) {
+            uLongf dst_size = static_cast<uLongf>(dst.size());
+            return compress2(dst.data(), &dst_size, src.data(), static_cast<uLong>(src.size()), level) == Z_OK ? static_cast<size_t>(dst_size) : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            uLongf dst_size = static_cast<uLongf>(dst.size());
+            return uncompress(dst.data(), &dst_size, src.data(), static_cast<uLong>(src_size)) == Z_OK ? static_cast<size_t>(dst_size) : 0;
+        }});
+
+    codecs.push_back({"zstd", "zstd", {1, 3, 9, 19},
+        [](size_t n) { return ZSTD_compressBound(n); },
+        [](int level, const Buffer& src, Buffer& dst) {
+            const size_t res = ZSTD_compress(dst.data(), dst.size(), src.data(), src.size(), level);
+            return ZSTD_isError(res) ? 0 : res;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            const size_t res = ZSTD_decompress(dst.data(), dst.size(), src.data(), src_size);
+            return ZSTD_isError(res) ? 0 : res;
+        }});
+
+    // level 1 is LZ4_compress_default, higher levels are LZ4HC levels
+    codecs.push_back({"lz4", "lz4", {1, LZ4HC_CLEVEL_DEFAULT, LZ4HC_CLEVEL_MAX},
+        [](size_t n) { return static_cast<size_t>(LZ4_compressBound(static_cast<int>(n))); },
+        [](int level, const Buffer& src, Buffer& dst) {
+            const char* in = reinterpret_cast<const char*>(src.data());
+            char* out = reinterpret_cast<char*>(dst.data());
+            const int res = level == 1 ? LZ4_compress_default(in, out, static_cast<int>(src.size()), static_cast<int>(dst.size()))
+                                       : LZ4_compress_HC(in, out, static_cast<int>(src.size()), static_cast<int>(dst.size()), level);
+            return res > 0 ? static_cast<size_t>(res) : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            const int res = LZ4_decompress_safe(reinterpret_cast<const char*>(src.data()), reinterpret_cast<char*>(dst.data()),
+                                                static_cast<int>(src_size), static_cast<int>(dst.size()));
+            return res > 0 ? static_cast<size_t>(res) : 0;
+        }});
+
+    codecs.push_back({"brotli", "brotli", {1, 5, 9},
+        [](size_t n) { return BrotliEncoderMaxCompressedSize(n); },
+        [](int level, const Buffer& src, Buffer& dst) {
+            size_t dst_size = dst.size();
+            return BrotliEncoderCompress(level, BROTLI_DEFAULT_WINDOW, BROTLI_MODE_GENERIC, src.size(), src.data(), &dst_size, dst.data()) ? dst_size : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            size_t dst_size = dst.size();
+            return BrotliDecoderDecompress(src_size, src.data(), &dst_size, dst.data()) == BROTLI_DECODER_RESULT_SUCCESS ? dst_size : 0;
+        }});
+
+    codecs.push_back({"snappy", "snappy", {0},
+        [](size_t n) { return snappy::MaxCompressedLength(n); },
+        [](int, const Buffer& src, Buffer& dst) {
+            size_t dst_size = 0;
+            snappy::RawCompress(reinterpret_cast<const char*>(src.data()), src.size(), reinterpret_cast<char*>(dst.data()), &dst_size);
+            return dst_size;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            size_t dst_size = 0;
+            const char* in = reinterpret_cast<const char*>(src.data());
+            if (!snappy::GetUncompressedLength(in, src_size, &dst_size) || dst_size > dst.size()) {
+                return static_cast<size_t>(0);
+            }
+            return snappy::RawUncompress(in, src_size, reinterpret_cast<char*>(dst.data())) ? dst_size : 0;
+        }});
+
+    codecs.push_back({"xz", "xz_utils", {0, 6},
+        [](size_t n) { return lzma_stream_buffer_bound(n); },
+        [](int level, const Buffer& src, Buffer& dst) {
+            size_t dst_pos = 0;
+            return lzma_easy_buffer_encode(static_cast<uint32_t>(level), LZMA_CHECK_CRC64, nullptr, src.data(), src.size(),
+                                           dst.data(), &dst_pos, dst.size()) == LZMA_OK ? dst_pos : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            uint64_t memlimit = UINT64_MAX;
+            size_t src_pos = 0;
+            size_t dst_pos = 0;
+            return lzma_stream_buffer_decode(&memlimit, 0, nullptr, src.data(), &src_pos, src_size,
+                                             dst.data(), &dst_pos, dst.size()) == LZMA_OK ? dst_pos : 0;
+        }});
+
+    codecs.push_back({"bzip2", "bzip2", {1, 9},
+        [](size_t n) { return n + n / 100 + 600; },
+        [](int level, const Buffer& src, Buffer& dst) {
+            unsigned int dst_size = static_cast<unsigned int>(dst.size());
+            return BZ2_bzBuffToBuffCompress(reinterpret_cast<char*>(dst.data()), &dst_size,
+                                            const_cast<char*>(reinterpret_cast<const char*>(src.data())), static_cast<unsigned int>(src.size()),
+                                            level, 0, 0) == BZ_OK ? static_cast<size_t>(dst_size) : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            unsigned int dst_size = static_cast<unsigned int>(dst.size());
+            return BZ2_bzBuffToBuffDecompress(reinterpret_cast<char*>(dst.data()), &dst_size,
+                                              const_cast<char*>(reinterpret_cast<const char*>(src.data())), static_cast<unsigned int>(src_size),
+                                              0, 0) == BZ_OK ? static_cast<size_t>(dst_size) : 0;
+        }});
+
+    const char* const blosc_compressors[] = {"blosclz", "lz4", "zstd"};
+    for (const char* compressor : blosc_compressors) {
+        const std::string name = std::string("blosc-") + compressor;
+        codecs.push_back({name, "c-blosc", {1, 5, 9},
+            [](size_t n) { return n + BLOSC_MAX_OVERHEAD; },
+            [name](int level, const Buffer& src, Buffer& dst) {
+                if (blosc_set_compressor(name.c_str() + std::strlen("blosc-")) < 0) {
+                    return static_cast<size_t>(0);
+                }
+                const int res = blosc_compress(level, BLOSC_SHUFFLE, 4, src.size(), src.data(), dst.data(), dst.size());
+                return res > 0 ? static_cast<size_t>(res) : 0;
+            },
+            [](const Buffer& src, size_t, Buffer& dst) {
+                const int res = blosc_decompress(src.data(), dst.data(), dst.size());
+                return res > 0 ? static_cast<size_t>(res) : 0;
+            }});
+    }
+
+    codecs.push_back({"lzo1x_1", "lzo", {1},
+        [](size_t n) { return n + n / 16 + 64 + 3; },
+        [](int, const Buffer& src, Buffer& dst) {
+            std::vector<unsigned char> wrkmem(LZO1X_1_MEM_COMPRESS);
+            lzo_uint dst_size = static_cast<lzo_uint>(dst.size());
+            return lzo1x_1_compress(const_cast<unsigned char*>(src.data()), static_cast<lzo_uint>(src.size()), dst.data(), &dst_size, wrkmem.data()) == LZO_E_OK
+                ? static_cast<size_t>(dst_size) : 0;
+        },
+        [](const Buffer& src, size_t src_size, Buffer& dst) {
+            lzo_uint dst_size = static_cast<lzo_uint>(dst.size());
+            return lzo1x_decompress_safe(const_cast<unsigned char*>(src.data()), static_cast<lzo_uint>(src_size), dst.data(), &dst_size, nullptr) == LZO_E_OK
+                ? static_cast<size_t>(dst_size) : 0;
+        }});
+
+    return codecs;
+}
+
+bool write_results(const char* path, size_t corpus_size, const std::vector<Result>& results)
+{
+    FILE* f = std::fopen(path, "w");
+    if (!f) {
+        std::perror(path);
+        return false;
+    }
+    std::fprintf(f, "{\n  \"corpus_size\": %lu,\n  \"results\": [\n", static_cast<unsigned long>(corpus_size));
+    for (size_t i = 0; i < results.size(); ++i) {
+        const Result& r = results[i];
+        std::fprintf(f, "    {\"codec\": \"%s\", \"package\": \"%s\", \"level\": %d, \"compressed_size\": %lu, \"ratio\": %.4f, "
+                        "\"compress_mb_s\": %.2f, \"decompress_mb_s\": %.2f}%s\n",
+                     r.codec.c_str(), r.package.c_str(), r.level, static_cast<unsigned long>(r.compressed_size),
+                     static_cast<double>(corpus_size) / r.compressed_size, r.compress_mb_s, r.decompress_mb_s,
+                     i + 1 < results.size() ? "," : "");
+    }
+    std::fprintf(f, "  ]\n}\n");
+    return std::fclose(f) == 0;
+}
+
+}  // namespace
+
+int main(int argc, char** argv)
+{
+    if (argc < 2) {
+        std::fprintf(stderr, "Usage: %s <results.json> [corpus size]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+    const size_t corpus_size = argc > 2 ? static_cast<size_t>(std::strtoul(argv[2], nullptr, 10)) : 16 * 1024 * 1024;
+    const int repeat = 3;
+
+    blosc_init();
+    blosc_set_nthreads(1);
+    if (lzo_init() != LZO_E_OK) {
+        std::fprintf(stderr, "lzo_init failed\n");
+        return EXIT_FAILURE;
+    }
+
+    const Buffer corpus = make_corpus(corpus_size);
+    Buffer decompressed(corpus_size);
+    std::vector<Result> results;
+    bool ok = true;
+
+    for (const Codec& codec : make_codecs()) {
+        Buffer compressed(codec.bound(corpus_size));
+        for (int level : codec.levels) {
+            size_t compressed_size = 0;
+            const double compress_time = best_seconds(repeat, [&] { compressed_size = codec.compress(level, corpus, compressed); });
+            size_t decompressed_size = 0;
+            const double decompress_time = best_seconds(repeat, [&] { decompressed_size = codec.decompress(compressed, compressed_size, decompressed); });
+            if (compressed_size == 0 || decompressed_size != corpus_size || decompressed != corpus) {
+                std::fprintf(stderr, "%s level %d: round-trip failed\n", codec.name.c_str(), level);
+                ok = false;
+                continue;
+            }
+            const Result result = {codec.name, codec.package, level, compressed_size,
+                                   mb_per_s(corpus_size, compress_time), mb_per_s(corpus_size, decompress_time)};
+            std::printf("%-14s level %2d: ratio %6.2f, compress %8.1f MB/s, decompress %8.1f MB/s\n", codec.name.c_str(), level,
+                        static_cast<double>(corpus_size) / compressed_size, result.compress_mb_s, result.decompress_mb_s);
+            results.push_back(result);
+        }
+    }
+
+    blosc_destroy();
+    if (!write_results(argv[1], corpus_size, results)) {
+        return EXIT_FAILURE;
+    }
+    return ok ? EXIT_SUCCESS : EXIT_FAILURE;
+}
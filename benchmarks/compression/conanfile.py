@@ -0,0 +1,47 @@
+import json
+import os
+from conans import ConanFile, CMake, tools
+
+
+class CompressionBenchmarkConan(ConanFile):
+    settings = "os", "compiler", "build_type", "arch"
+    generators = "cmake"
+    requires = (
+        "zlib/1.2.11",
+        "zstd/1.4.8",
+        "lz4/1.9.3",
+        "brotli/1.0.9",
+        "snappy/1.1.8",
+        "xz_utils/5.2.5",
+        "bzip2/1.0.8",
+        "c-blosc/1.20.1",
+        "lzo/2.10",
+    )
+
+    @property
+    def _results_path(self):
+        return os.path.join(self.build_folder, "compression-benchmark.json")
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+        if tools.cross_building(self.settings):
+            self.output.warn("Cross building: the benchmark is not run")
+            return
+        corpus_size = tools.get_env("COMPRESSION_BENCHMARK_CORPUS_SIZE", str(16 * 1024 * 1024))
+        self.run("{} {} {}".format(os.path.join("bin", "compression_benchmark"), self._results_path, corpus_size),
+                 run_environment=True)
+        self._add_package_info()
+
+    def _add_package_info(self):
+        results = json.loads(tools.load(self._results_path))
+        results["settings"] = {name: str(self.settings.get_safe(name)) for name in ("os", "arch", "compiler", "compiler.version", "build_type")}
+        results["packages"] = {}
+        for name in self.requires:
+            results["packages"][name] = {
+                "version": self.deps_cpp_info[name].version,
+                "options": {key: str(value) for key, value in self.options[name].items()},
+            }
+        tools.save(self._results_path, json.dumps(results, indent=2, sort_keys=True))
+        self.output.info("Benchmark results written to {}".format(self._results_path))
@@ -5,6 +5,7 @@ from conans.errors import ConanException
 
 from conans.errors import ConanInvalidConfiguration
 import glob
+import json
 import os
 import sys
 import shlex
@@ -66,6 +67,9 @@ class BoostConan(ConanFile):
     topics = ("conan", "boost", "libraries", "cpp")
 
     _options = None
+    _cached_dependencies = None
+    _cached_dependency_closures = None
+    _cached_requirement_modules = None
 
     options = {
         "shared": [True, False],
@@ -132,6 +136,7 @@ class BoostConan(ConanFile):
 
     def export(self):
         self.copy(self._dependency_filename, src="dependencies", dst="dependencies")
+        self.copy(self._dependency_json_filename, src="dependencies", dst="dependencies")
 
     @property
     def _min_compiler_version_default_cxx11(self):
@@ -157,25 +162,61 @@ class BoostConan(ConanFile):
     def _dependency_filename(self):
         return "dependencies-{}.yml".format(self.version)
 
+    @property
+    def _dependency_json_filename(self):
+        # Generated from the yml file by `rebuild-dependencies.py`: much faster to load
+        return "dependencies-{}.json".format(self.version)
+
     @property
     def _dependencies(self):
-        dependencies_filepath = os.path.join(self.recipe_folder, "dependencies", self._dependency_filename)
-        if not os.path.isfile(dependencies_filepath):
-            raise ConanException("Cannot find {}".format(dependencies_filepath))
-        return yaml.load(open(dependencies_filepath))
+        if self._cached_dependencies is None:
+            json_filepath = os.path.join(self.recipe_folder, "dependencies", self._dependency_json_filename)
+            dependencies_filepath = os.path.join(self.recipe_folder, "dependencies", self._dependency_filename)
+            if os.path.isfile(json_filepath):
+                with open(json_filepath) as f:
+                    self._cached_dependencies = json.load(f)
+            elif os.path.isfile(dependencies_filepath):
+                with open(dependencies_filepath) as f:
+                    self._cached_dependencies = yaml.safe_load(f)
+            else:
+                raise ConanException("Cannot find {}".format(dependencies_filepath))
+        return self._cached_dependencies
+
+    @property
+    def _dependency_closures(self):
+        """
+        Map each module to the set of modules it needs (itself included).
+        The sets are built in topological order, so each module's closure is the union of the closures of its direct dependencies.
+        """
+        if self._cached_dependency_closures is None:
+            tree = self._dependencies["dependencies"]
+            remaining = {name: set(deps) for name, deps in tree.items()}
+            closures = {}
+            while remaining:
+                ready = [name for name, deps in remaining.items() if deps.issubset(closures)]
+                if not ready:
+                    raise ConanException("{} has a dependency cycle: {}".format(self._dependency_filename, sorted(remaining)))
+                for name in ready:
+                    closures[name] = frozenset({name}.union(*(closures[dep] for dep in tree[name])))
+                    del remaining[name]
+            self._cached_dependency_closures = closures
+        return self._cached_dependency_closures
+
+    @property
+    def _requirement_modules(self):
+        """
+        Map each conan requirement to the modules that need it
+        """
+        if self._cached_requirement_modules is None:
+            requirement_modules = {}
+            for name, reqs in self._dependencies["requirements"].items():
+                for req in reqs:
+                    requirement_modules.setdefault(req, []).append(name)
+            self._cached_requirement_modules = requirement_modules
+        return self._cached_requirement_modules
 
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return self._dependency_closures[name]
 
     @property
     def _source_subfolder(self):
@@ -326,10 +367,9 @@ class BoostConan(ConanFile):
         """
         Return true when dependency is required according to the dependencies-x.y.z.yml file
         """
-        for name, reqs in self._dependencies["requirements"].items():
-            if dependency in reqs:
-                if not self.options.get_safe("without_{}".format(name), True):
-                    return True
+        for name in self._requirement_modules.get(dependency, ()):
+            if not self.options.get_safe("without_{}".format(name), True):
+                return True
         return False
 
     @property
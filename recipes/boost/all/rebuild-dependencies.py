@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
+import contextlib
 import dataclasses
+import os
 from pathlib import Path
 import re
+import shutil
 import subprocess
+import sys
 import tempfile
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
 from conans import tools
 import logging
@@ -102,19 +108,155 @@ class BoostDependencies(object):
     export: BoostDependenciesExport
 
 
+@dataclasses.dataclass
+class JamToken(object):
+    kind: str  # "using", "lib", "searched-lib" or "boost-lib"
+    name: str
+
+
+@dataclasses.dataclass
+class JamfileScan(object):
+    path: Path
+    tokens: List[JamToken] = dataclasses.field(default_factory=list)
+    # Comments and strings: from the first `#` or `"` of a line up to the end of that line
+    comment_string_spans: List[Tuple[int, int]] = dataclasses.field(default_factory=list)
+
+    def names(self, *kinds: str) -> List[str]:
+        return [token.name for token in self.tokens if token.kind in kinds]
+
+
+_JAM_TOKEN_REGEX = re.compile(r"(?P<comment_string>[#\"][^\n]*)|(?<![\w-])(?P<kind>using|searched-lib|boost-lib|lib)\s+(?P<name>[^\s;:]+)")
+
+
+def scan_jamfile(path: Path, text: str) -> JamfileScan:
+    """
+    Tokenize a Jamfile in a single pass.
+    Tokens inside comments and strings are skipped.
+    """
+    scan = JamfileScan(path=path)
+    for match in _JAM_TOKEN_REGEX.finditer(text):
+        if match.group("comment_string") is not None:
+            scan.comment_string_spans.append(match.span())
+        else:
+            scan.tokens.append(JamToken(kind=match.group("kind"), name=match.group("name")))
+    return scan
+
+
+def scan_jamfiles(paths: List[Path]) -> Dict[Path, JamfileScan]:
+    return {path: scan_jamfile(path, path.read_text()) for path in paths}
+
+
+def benchmark_jamfile_scan(boost_path: Path, repeat: int) -> None:
+    paths = sorted(boost_path.glob("libs/*/build/Jamfile*"))
+    texts = [(path, path.read_text()) for path in paths]
+    nb_bytes = sum(len(text) for _, text in texts)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path, text in texts:
+            scan_jamfile(path, text)
+    duration = (time.perf_counter() - start) / repeat
+    print("Scanned {} Jamfiles ({:.1f} KiB) in {:.2f} ms ({:.1f} MiB/s)".format(
+        len(texts), nb_bytes / 1024, duration * 1000, nb_bytes / (1024 * 1024) / duration if duration else float("inf")))
+
+
+# Bump when the cached data format, or the way it is extracted, changes
+CACHE_FORMAT = 2
+
+
+class DependencyCache(object):
+    """
+    On-disk cache of data extracted from boost, keyed by git commit sha's and the boostdep version.
+    Every entry is a json file: <path>/<kind>/<key>.json
+    """
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def _entry_path(self, kind: str, key: str) -> Path:
+        return self.path / kind / "{}.json".format(key)
+
+    def __contains__(self, kind_key: Tuple[str, Optional[str]]) -> bool:
+        kind, key = kind_key
+        return self.enabled and key is not None and self._entry_path(kind, key).is_file()
+
+    def get(self, kind: str, key: Optional[str]):
+        if (kind, key) not in self:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(self._entry_path(kind, key).read_text())
+
+    def put(self, kind: str, key: Optional[str], value) -> None:
+        if not self.enabled or key is None:
+            return
+        entry_path = self._entry_path(kind, key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write + rename so concurrent workers never read a partial entry
+        tmp_path = entry_path.with_suffix(".{}.tmp".format(os.getpid()))
+        tmp_path.write_text(json.dumps(value, sort_keys=True))
+        os.replace(str(tmp_path), str(entry_path))
+
+    def clear(self) -> None:
+        if self.enabled and self.path.exists():
+            print("Clearing cache {}".format(self.path))
+            shutil.rmtree(str(self.path))
+
+    def size(self) -> Tuple[int, int]:
+        if not self.enabled or not self.path.exists():
+            return 0, 0
+        entries = list(self.path.glob("*/*.json"))
+        return len(entries), sum(entry.stat().st_size for entry in entries)
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        nb_entries, nb_bytes = self.size()
+        print("Cache {}: {} entries, {:.1f} KiB ({} hits, {} misses)".format(self.path, nb_entries, nb_bytes / 1024, self.hits, self.misses))
+
+
+PHASES = (
+    "worktree",
+    "submodules",
+    "boostdep",
+    "dependencies",
+)
+
+
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 boost_path: Optional[Path] = None, bin_paths: Optional[List[str]] = None, cache: Optional[DependencyCache] = None):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self._boost_path = boost_path
+        self._cached_bin_paths = bin_paths
+        self._cached_library_shas = None
+        self._jamfile_scans = {}  # type: Dict[str, Optional[JamfileScan]]
+        self.cache = cache or DependencyCache(None)
+        self.timings = {}  # type: Dict[str, float]
 
     @property
     def boost_path(self) -> Path:
+        if self._boost_path:
+            return self._boost_path
         return self.tmppath / "boost"
 
+    @contextlib.contextmanager
+    def timed(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.) + time.perf_counter() - start
+
     def do_git_update(self) -> None:
         if not self.boost_path.exists():
             with tools.chdir(str(self.tmppath)):
@@ -134,7 +276,45 @@ class BoostDependencyBuilder(object):
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
 
-    def do_git_submodule_update(self):
+    def do_git_worktree_add(self, main_path: Path) -> None:
+        if self.boost_path.exists():
+            return
+        with tools.chdir(str(main_path)):
+            print("Adding git worktree {} for version {}".format(self.boost_path, self.boost_version))
+            subprocess.check_call(["git", "worktree", "prune"])
+            subprocess.check_call(["git", "worktree", "add", "--detach", str(self.boost_path), "boost-{}".format(self.boost_version)])
+
+    @staticmethod
+    def _submodules() -> Dict[str, str]:
+        """
+        Return the submodules (name -> path) of the git repo in the current directory
+        """
+        try:
+            output = subprocess.check_output(["git", "config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"], text=True)
+        except subprocess.CalledProcessError:
+            return {}
+        submodules = {}
+        for line in output.splitlines():
+            key, path = line.split(maxsplit=1)
+            submodules[key[len("submodule."):-len(".path")]] = path
+        return submodules
+
+    def _git_submodule_init(self, reference_path: Optional[Path]) -> None:
+        if reference_path is None:
+            subprocess.check_call(["git", "submodule", "update", "--init"])
+            return
+        # Borrow the objects of the submodules already cloned by the main repo
+        unreferenced = []
+        for name, path in self._submodules().items():
+            reference = reference_path / ".git" / "modules" / name
+            if reference.is_dir():
+                subprocess.check_call(["git", "submodule", "update", "--init", "--reference", str(reference), "--", path])
+            else:
+                unreferenced.append(path)
+        if unreferenced:
+            subprocess.check_call(["git", "submodule", "update", "--init", "--"] + unreferenced)
+
+    def do_git_submodule_update(self, reference_path: Optional[Path] = None):
         with tools.chdir(str(self.boost_path)):
             if not self.unsafe:
                 # De-init + init to make sure that boostdep won't detect a new or removed boost library
@@ -148,61 +328,104 @@ class BoostDependencyBuilder(object):
                 print("version {} does not exist".format(self.boost_version))
                 raise
 
+            self._cached_library_shas = None
+            if self._is_fully_cached():
+                print("All data of version {} is cached: skipping git submodule update".format(self.boost_version))
+                return
+
             print("Re-init git submodules")
-            subprocess.check_call(["git", "submodule", "update", "--init"])
+            self._git_submodule_init(reference_path)
 
             print("Removing unknown files/directories")
             subprocess.check_call(["git", "clean", "-d", "-f"])
 
     def do_install_boostdep(self):
-        with tools.chdir(str(self.boost_path)):
-            print("Installing boostdep/{}".format(self.boostdep_version))
-            subprocess.check_call(["conan", "install", "boostdep/{}@".format(self.boostdep_version), "-g", "json"])
+        self._cached_bin_paths = install_boostdep(self.boostdep_version, self.boost_path)
 
     @property
-    def _bin_paths(self):
-        with tools.chdir(str(self.boost_path)):
-            data = json.loads(open("conanbuildinfo.json").read())
-            return data["dependencies"][0]["bin_paths"]
-
-    _GREP_IGNORE_PREFIX = ("#", "\"")
-    _GREP_IGNORE_PARTS = ("boost", "<", ">")
+    def _bin_paths(self) -> List[str]:
+        if self._cached_bin_paths is None:
+            with tools.chdir(str(self.boost_path)):
+                data = json.loads(open("conanbuildinfo.json").read())
+                self._cached_bin_paths = data["dependencies"][0]["bin_paths"]
+        return self._cached_bin_paths
 
-    @classmethod
-    def _grep_libs(cls, regex, text):
-        res = set()
-        for m in re.finditer(regex, text, flags=re.MULTILINE):
-            # If text before main capture group contains a string or a comment => ignore
-            ignore = False
-            for ign in cls._GREP_IGNORE_PREFIX:
-                if ign in m.group(1):
-                    ignore = True
-            if ignore:
-                continue
-            l = m.group(2).lower()
-            ignore = False
-            for ign in cls._GREP_IGNORE_PARTS:
-                if ign in l:
-                    ignore = True
-            if ignore:
-                continue
-            res.add(l)
-        return list(res)
+    @property
+    def _library_shas(self) -> Dict[str, str]:
+        """
+        Commit sha of every library submodule (+ the tree sha of libs itself), read from the superproject only
+        """
+        if self._cached_library_shas is None:
+            with tools.chdir(str(self.boost_path)):
+                shas = {"": subprocess.check_output(["git", "rev-parse", "HEAD:libs"], text=True).strip()}
+                for line in subprocess.check_output(["git", "ls-tree", "HEAD", "libs/"], text=True).splitlines():
+                    meta, path = line.split("\t", 1)
+                    mode, objtype, sha = meta.split()
+                    if objtype == "commit":
+                        shas[path[len("libs/"):]] = sha
+            self._cached_library_shas = shas
+        return self._cached_library_shas
+
+    def _cache_key(self, library: str = "") -> Optional[str]:
+        """
+        Cache key of a library, or of all libraries together when library is empty.
+        Returns None when the library is not a submodule (and cannot be cached).
+        """
+        sha = self._library_shas.get(library)
+        if sha is None:
+            return None
+        return "{}-{}-{}".format(CACHE_FORMAT, self.boostdep_version, sha)
+
+    def _is_fully_cached(self) -> bool:
+        if not self.cache.enabled:
+            return False
+        boostdep_data = self.cache.get("boostdep", self._cache_key())
+        if boostdep_data is None:
+            return False
+        buildables = boostdep_data["buildables"]
+        dependency_tree = boostdep_data["dependency_tree"]
+        configure_options = [option for option in CONFIGURE_OPTIONS if option in buildables and option in dependency_tree]
+        return all(("requirements", self._cache_key(option)) in self.cache for option in configure_options) and \
+            all(("libs", self._cache_key(buildable)) in self.cache for buildable in buildables)
+
+    _REQUIREMENT_IGNORE_PARTS = ("boost", "<", ">")
+
+    def _jamfile(self, library: str) -> Optional[Path]:
+        build_path = self.boost_path / "libs" / library / "build"
+        for jam_name in ("Jamfile.v2", "Jamfile"):
+            if (build_path / jam_name).is_file():
+                return build_path / jam_name
+        return None
+
+    def _scan_jamfiles(self, libraries: List[str]) -> None:
+        """
+        Scan the Jamfiles of libraries in one batch. All consumers share the result.
+        """
+        jamfiles = {library: self._jamfile(library) for library in libraries if library not in self._jamfile_scans}
+        scans = scan_jamfiles([jamfile for jamfile in jamfiles.values() if jamfile])
+        for library, jamfile in jamfiles.items():
+            self._jamfile_scans[library] = scans[jamfile] if jamfile else None
+
+    def _jamfile_scan(self, library: str) -> Optional[JamfileScan]:
+        if library not in self._jamfile_scans:
+            self._scan_jamfiles([library])
+        return self._jamfile_scans[library]
 
     def _grep_requirements(self, component: str) -> List[str]:
-        jam = self.boost_path / "libs" / component / "build" / "Jamfile.v2"
-        if not jam.is_file():
-            jam = self.boost_path / "libs" / component / "build" / "Jamfile"
-        if not jam.is_file():
+        cache_key = self._cache_key(component)
+        requirements = self.cache.get("requirements", cache_key)
+        if requirements is None:
+            requirements = self._grep_jam_requirements(component)
+            self.cache.put("requirements", cache_key, requirements)
+        return requirements
+
+    def _grep_jam_requirements(self, component: str) -> List[str]:
+        scan = self._jamfile_scan(component)
+        if scan is None:
             log.warning("Can't find Jamfile for %s. Unable to determine dependencies.", component)
             return []
-        contents = jam.open().read()
-
-        using = self._grep_libs("\n(.*)using\\s+([^ ;:]+)\\s*", contents)
-        libs = self._grep_libs("\n(.*)\\s(?:searched-)?lib\\s+([^ \t\n;:]+)", contents)
-
-        requirements = using + libs
-        return requirements
+        requirements = set(name.lower() for name in scan.names("using", "lib", "searched-lib"))
+        return sorted(req for req in requirements if not any(ign in req for ign in self._REQUIREMENT_IGNORE_PARTS))
 
     def _sort_requirements(self, requirements: List[str]) -> Tuple[List[str], Dict[str, List[str]], List[str]]:
         conan_requirements = set()
@@ -226,7 +449,7 @@ class BoostDependencyBuilder(object):
             unknown_libs.add(req)
         return list(conan_requirements), system_libs, list(unknown_libs)
 
-    def do_boostdep_collect(self) -> BoostDependencies:
+    def _run_boostdep(self) -> Tuple[List[str], Dict[str, List[str]]]:
         with tools.chdir(str(self.boost_path)):
             with tools.environment_append({"PATH": self._bin_paths}):
                 buildables = subprocess.check_output(["boostdep", "--list-buildable"], text=True)
@@ -253,6 +476,18 @@ class BoostDependencyBuilder(object):
 
                 log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
                 log.debug(pprint.pformat(dependency_tree))
+        return buildables, dependency_tree
+
+    def do_boostdep_collect(self) -> BoostDependencies:
+        cache_key = self._cache_key()
+        boostdep_data = self.cache.get("boostdep", cache_key)
+        if boostdep_data is None:
+            buildables, dependency_tree = self._run_boostdep()
+            self.cache.put("boostdep", cache_key, {"buildables": buildables, "dependency_tree": dependency_tree})
+        else:
+            buildables, dependency_tree = boostdep_data["buildables"], boostdep_data["dependency_tree"]
+
+        self._scan_jamfiles([buildable for buildable in buildables if ("libs", self._cache_key(buildable)) not in self.cache])
 
         filtered_dependency_tree = {k: [d for d in v if d in buildables] for k, v in dependency_tree.items() if k in buildables}
 
@@ -336,21 +571,34 @@ class BoostDependencyBuilder(object):
     def _boostify_library(lib: str) -> str:
         return "boost_{}".format(lib)
 
+    def _grep_buildable_libraries(self, buildable: str) -> List[str]:
+        cache_key = self._cache_key(buildable)
+        buildable_libs = self.cache.get("libs", cache_key)
+        if buildable_libs is None:
+            buildable_libs = self._grep_jam_buildable_libraries(buildable)
+            self.cache.put("libs", cache_key, buildable_libs)
+        return buildable_libs
+
+    def _grep_jam_buildable_libraries(self, buildable: str) -> List[str]:
+        scan = self._jamfile_scan(buildable)
+        if scan is None:
+            raise Exception("Cannot find jam build file for {}".format(buildable))
+        buildable_libs = set()
+        for token in scan.tokens:
+            if token.kind not in ("lib", "boost-lib") or not re.fullmatch(r"[a-zA-Z0-9_]+", token.name):
+                continue
+            lib = "boost_{}".format(token.name) if token.kind == "boost-lib" else token.name
+            if lib.startswith("boost_"):
+                buildable_libs.add(lib[len("boost_"):])
+        return sorted(buildable_libs)
+
     def do_create_libraries(self, boost_dependencies: BoostDependencies):
         libraries = {}
         module_provides_extra = {}
 
         #  Look for the names of libraries in Jam build files
         for buildable in boost_dependencies.buildables:
-            construct_jam = lambda jam_ext : self.boost_path / "libs" / buildable / "build" / "Jamfile{}".format(jam_ext)
-            try:
-                buildable_jam = next(construct_jam(jam_ext) for jam_ext in ("", ".v2") if construct_jam(jam_ext).is_file())
-            except StopIteration:
-                raise Exception("Cannot find jam build file for {}".format(buildable))
-            jam_text = buildable_jam.read_text()
-            buildable_libs = re.findall("[ \n](boost-)?lib ([a-zA-Z0-9_]+)[ \n]", jam_text)
-            buildable_libs = set("boost_{}".format(lib) if lib_prefix else lib for lib_prefix, lib in buildable_libs)
-            buildable_libs = set(l[len("boost_"):] for l in buildable_libs if l.startswith("boost_"))  # list(filter(lambda l: l.startswith("boost"), buildable_libs))
+            buildable_libs = set(self._grep_buildable_libraries(buildable))
 
             if not buildable_libs:
                 # Some boost releases support multiple python versions
@@ -395,6 +643,10 @@ class BoostDependencyBuilder(object):
     def _outputpath(self) -> Path:
         return self.outputdir / "dependencies-{}.yml".format(self.boost_version)
 
+    @property
+    def _compiled_outputpath(self) -> Path:
+        return compiled_dependency_path(self._outputpath)
+
     @classmethod
     def _sort_item(cls, item):
         if isinstance(item, dict):
@@ -425,21 +677,289 @@ class BoostDependencyBuilder(object):
         print("Creating {}".format(self.outputdir))
         with self._outputpath.open("w") as fout:
             yaml.dump(data, fout)
+        write_compiled_dependency_file(data, self._compiled_outputpath)
+
+
+def install_boostdep(boostdep_version: str, install_folder: Path) -> List[str]:
+    print("Installing boostdep/{}".format(boostdep_version))
+    subprocess.check_call(["conan", "install", "boostdep/{}@".format(boostdep_version), "-g", "json", "-if", str(install_folder)])
+    data = json.loads((install_folder / "conanbuildinfo.json").read_text())
+    return data["dependencies"][0]["bin_paths"]
+
+
+def print_timings(timings: Dict[str, Dict[str, float]]) -> None:
+    print("Timings (seconds):")
+    print("{:<10}".format("version") + "".join("{:>14}".format(phase) for phase in PHASES) + "{:>14}".format("total"))
+    for version, version_timings in timings.items():
+        line = "{:<10}".format(version)
+        line += "".join("{:>14.1f}".format(version_timings[phase]) if phase in version_timings else "{:>14}".format("-") for phase in PHASES)
+        line += "{:>14.1f}".format(sum(version_timings.values()))
+        print(line)
+
+
+def _collect_version_in_worktree(builder: BoostDependencyBuilder, main_path: Path, log_path: Path) -> Tuple[Dict[str, float], bool, int, int]:
+    """
+    Process pool worker: collect the dependencies of one boost version in its own git worktree.
+    All output is redirected to log_path, so the parent can print it in a deterministic order.
+    """
+    with log_path.open("w") as flog:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(flog.fileno(), sys.stdout.fileno())
+        os.dup2(flog.fileno(), sys.stderr.fileno())
+        try:
+            with builder.timed("worktree"):
+                builder.do_git_worktree_add(main_path)
+            with builder.timed("submodules"):
+                builder.do_git_submodule_update(reference_path=main_path)
+            with builder.timed("dependencies"):
+                builder.do_create_dependency_file()
+            success = True
+        except Exception as e:
+            log.error("Collecting dependencies of boost %s failed: %s", builder.boost_version, e)
+            success = False
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return builder.timings, success, builder.cache.hits, builder.cache.misses
+
+
+def main_parallel(ns: argparse.Namespace, boost_versions: List[str], cache: DependencyCache) -> int:
+    main_path = ns.tmppath / "boost"
+    worktrees_path = ns.tmppath / "boost-worktrees"
+
+    main_builder = BoostDependencyBuilder(
+        boost_version=None,
+        boostdep_version=ns.boostdep_version,
+        git_url=ns.git_url,
+        outputdir=ns.outputdir,
+        tmppath=ns.tmppath,
+        unsafe=ns.unsafe,
+    )
+    if ns.git_update:
+        main_builder.do_git_update()
+    elif not main_path.exists():
+        log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
+        return 1
+
+    with tools.chdir(str(main_path)):
+        # All worktrees borrow the submodule objects of the main repo
+        print("Initializing git submodules of main repo")
+        subprocess.check_call(["git", "submodule", "update", "--init"])
+
+    worktrees_path.mkdir(exist_ok=True)
+    boostdep_path = worktrees_path / "boostdep"
+    boostdep_path.mkdir(exist_ok=True)
+    with main_builder.timed("boostdep"):
+        bin_paths = install_boostdep(ns.boostdep_version, boostdep_path)
+
+    print("Collecting {} boost versions using {} jobs".format(len(boost_versions), ns.jobs))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=ns.jobs) as executor:
+        futures = {}
+        for boost_version in boost_versions:
+            builder = BoostDependencyBuilder(
+                boost_version=boost_version,
+                boostdep_version=ns.boostdep_version,
+                git_url=ns.git_url,
+                outputdir=ns.outputdir.resolve(),
+                tmppath=ns.tmppath,
+                unsafe=ns.unsafe,
+                boost_path=worktrees_path / boost_version,
+                bin_paths=bin_paths,
+                cache=cache,
+            )
+            log_path = worktrees_path / "{}.log".format(boost_version)
+            futures[boost_version] = (executor.submit(_collect_version_in_worktree, builder, main_path, log_path), log_path)
+
+        timings = {"boostdep": main_builder.timings}
+        failed = []
+        for boost_version, (future, log_path) in futures.items():
+            version_timings, success, cache_hits, cache_misses = future.result()
+            cache.hits += cache_hits
+            cache.misses += cache_misses
+            print("===== {} =====".format(boost_version))
+            print(log_path.read_text(), end="")
+            timings[boost_version] = version_timings
+            if not success:
+                failed.append(boost_version)
+
+    print_timings(timings)
+    cache.report()
+    if failed:
+        log.error("Failed boost versions: %s", ", ".join(failed))
+        return 1
+    return 0
+
+
+def compiled_dependency_path(yml_path: Path) -> Path:
+    return yml_path.with_suffix(".json")
+
+
+def write_compiled_dependency_file(data: Dict, json_path: Path) -> None:
+    with json_path.open("w") as fout:
+        json.dump(data, fout, indent=2, sort_keys=True)
+        fout.write("\n")
+
+
+def compile_dependency_files(outputdir: Path) -> None:
+    for yml_path in sorted(outputdir.glob("dependencies-*.yml")):
+        json_path = compiled_dependency_path(yml_path)
+        print("Compiling {} into {}".format(yml_path, json_path))
+        write_compiled_dependency_file(yaml.safe_load(yml_path.open()), json_path)
+
+
+def check_dependency_files(outputdir: Path) -> int:
+    errors = 0
+    for yml_path in sorted(outputdir.glob("dependencies-*.yml")):
+        json_path = compiled_dependency_path(yml_path)
+        if not json_path.is_file():
+            log.error("%s is missing. Re-execute this script with -C.", json_path)
+            errors += 1
+            continue
+        if yaml.safe_load(yml_path.open()) != json.load(json_path.open()):
+            log.error("%s does not match %s. Re-execute this script with -C.", json_path, yml_path)
+            errors += 1
+    for json_path in sorted(outputdir.glob("dependencies-*.json")):
+        if not json_path.with_suffix(".yml").is_file():
+            log.error("%s has no matching yml file.", json_path)
+            errors += 1
+    if not errors:
+        print("All compiled dependency files match their yml file")
+    return 1 if errors else 0
+
+
+class OldDependencyLookups(object):
+    """
+    Dependency lookups of conanfile.py before the module closures were precomputed:
+    the yml file is parsed again on every access.
+    """
+    def __init__(self, yml_path: Path):
+        self.yml_path = yml_path
+        self.loads = 0
+
+    @property
+    def dependencies(self) -> Dict:
+        self.loads += 1
+        with self.yml_path.open() as f:
+            return yaml.load(f, Loader=yaml.FullLoader)
+
+    def all_dependent_modules(self, name: str) -> frozenset:
+        dependencies = {name}
+        while True:
+            new_dependencies = set()
+            for dependency in dependencies:
+                new_dependencies.update(set(self.dependencies["dependencies"][dependency]))
+                new_dependencies.update(dependencies)
+            if len(new_dependencies) > len(dependencies):
+                dependencies = new_dependencies
+            else:
+                break
+        return frozenset(dependencies)
+
+    def with_dependency(self, dependency: str, modules: List[str]) -> bool:
+        for name, reqs in self.dependencies["requirements"].items():
+            if dependency in reqs:
+                if name in modules:
+                    return True
+        return False
+
+
+class DependencyLookups(object):
+    """
+    Dependency lookups of conanfile.py: the compiled json file is loaded once,
+    module closures are computed in topological order and requirements are indexed.
+    Keep in sync with `_dependencies`, `_dependency_closures` and `_requirement_modules` of conanfile.py.
+    """
+    def __init__(self, yml_path: Path):
+        json_path = compiled_dependency_path(yml_path)
+        self.loads = 1
+        if json_path.is_file():
+            with json_path.open() as f:
+                self.dependencies = json.load(f)
+        else:
+            with yml_path.open() as f:
+                self.dependencies = yaml.safe_load(f)
+
+        tree = self.dependencies["dependencies"]
+        remaining = {name: set(deps) for name, deps in tree.items()}
+        self.closures = {}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if deps.issubset(self.closures)]
+            if not ready:
+                raise Exception("Dependency cycle detected. Remaining tree: {}".format(sorted(remaining)))
+            for name in ready:
+                self.closures[name] = frozenset({name}.union(*(self.closures[dep] for dep in tree[name])))
+                del remaining[name]
+
+        self.requirement_modules = {}
+        for name, reqs in self.dependencies["requirements"].items():
+            for req in reqs:
+                self.requirement_modules.setdefault(req, []).append(name)
+
+    def all_dependent_modules(self, name: str) -> frozenset:
+        return self.closures[name]
+
+    def with_dependency(self, dependency: str, modules: List[str]) -> bool:
+        return any(name in modules for name in self.requirement_modules.get(dependency, ()))
+
+
+def run_recipe_lookups(lookups_class, yml_path: Path, modules: List[str]):
+    """
+    Do the lookups of one recipe instance: _with_dependency for every conan requirement (configure, requirements),
+    and _all_dependent_modules for every module (package_info).
+    All modules are enabled.
+    """
+    lookups = lookups_class(yml_path)
+    requirements = [lookups.with_dependency(requirement, modules) for requirement in CONAN_REQUIREMENTS]
+    closures = [lookups.all_dependent_modules(module) for module in modules]
+    return lookups.loads, requirements, closures
+
+
+def benchmark_dependency_closures(outputdir: Path, repeat: int) -> int:
+    errors = 0
+    for yml_path in sorted(outputdir.glob("dependencies-*.yml")):
+        modules = sorted(yaml.safe_load(yml_path.open())["dependencies"])
+        results = {}
+        durations = {}
+        for lookups_class in (OldDependencyLookups, DependencyLookups):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                results[lookups_class] = run_recipe_lookups(lookups_class, yml_path, modules)
+            durations[lookups_class] = (time.perf_counter() - start) / repeat
+        old_loads, old_requirements, old_closures = results[OldDependencyLookups]
+        new_loads, new_requirements, new_closures = results[DependencyLookups]
+        old_duration, new_duration = durations[OldDependencyLookups], durations[DependencyLookups]
+        print("{}: {} modules, old {:.2f} ms ({} file loads), new {:.2f} ms ({} file load), {:.0f}x faster".format(
+            yml_path.name, len(modules), old_duration * 1000, old_loads, new_duration * 1000, new_loads,
+            old_duration / new_duration if new_duration else float("inf")))
+        if (old_requirements, old_closures) != (new_requirements, new_closures):
+            log.error("%s: the old and new lookups disagree", yml_path)
+            errors += 1
+    return 1 if errors else 0
 
 
 def main(args=None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="verbose output")
-    parser.add_argument("-t", dest="tmppath", help="temporary folder where to clone boost (default is system temporary folder)")
+    parser.add_argument("-t", dest="tmppath", type=Path, help="temporary folder where to clone boost (default is system temporary folder)")
     parser.add_argument("-d", dest="boostdep_version", default="1.75.0", type=str, help="boostdep version")
     parser.add_argument("-u", dest="git_url", default=BOOST_GIT_URL, help="boost git url")
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
-    parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation (mostly obsoleted by the extraction cache)")
+    parser.add_argument("--cache-dir", dest="cache_dir", default=None, type=Path, help="folder of the extraction cache (default is <tmppath>/boost-dependencies-cache)")
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true", help="do not use (nor update) the extraction cache")
+    parser.add_argument("--clear-cache", dest="clear_cache", action="store_true", help="clear the extraction cache before starting")
+    parser.add_argument("-j", dest="jobs", default=1, type=int, help="number of boost versions to process in parallel, each in its own git worktree (only used with -A)")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
     version_group.add_argument("-A", dest="boost_version", action="store_const", const=None, help="All boost versions")
+    version_group.add_argument("-C", dest="compile_only", action="store_true", help="only (re)generate the json files from the existing yml files")
+    version_group.add_argument("-c", dest="check_only", action="store_true", help="only check whether the json files match the yml files")
+    version_group.add_argument("--benchmark-scan", dest="benchmark_scan", default=0, type=int, metavar="REPEAT",
+                               help="only time the Jamfile scanner REPEAT times over the libraries of the checked out boost tree")
+    version_group.add_argument("--benchmark-closures", dest="benchmark_closures", default=0, type=int, metavar="REPEAT",
+                               help="only time the old and new module closure and requirement lookups of conanfile.py REPEAT times over every dependency file")
     ns = parser.parse_args(args)
 
     logging.basicConfig(format="[%(levelname)s] %(message)s")
@@ -453,8 +973,31 @@ def main(args=None) -> int:
         ns.outputdir = Path("dependencies")
     print("Dependencies folder is {}".format(ns.outputdir))
 
+    if ns.check_only:
+        return check_dependency_files(ns.outputdir)
+
+    if ns.benchmark_closures:
+        return benchmark_dependency_closures(ns.outputdir, ns.benchmark_closures)
+
     ns.outputdir.mkdir(exist_ok=True)
 
+    if ns.compile_only:
+        compile_dependency_files(ns.outputdir)
+        return 0
+
+    if ns.benchmark_scan:
+        benchmark_jamfile_scan(ns.tmppath / "boost", ns.benchmark_scan)
+        return 0
+
+    if ns.no_cache:
+        cache_path = None
+    else:
+        cache_path = ns.cache_dir or ns.tmppath / "boost-dependencies-cache"
+        print("Cache folder is {}".format(cache_path))
+    cache = DependencyCache(cache_path)
+    if ns.clear_cache:
+        cache.clear()
+
     git_update_done = False
 
     if ns.boost_version is None:
@@ -463,6 +1006,10 @@ def main(args=None) -> int:
     else:
         boost_versions = [ns.boost_version]
 
+    if ns.jobs > 1 and len(boost_versions) > 1:
+        return main_parallel(ns, boost_versions, cache)
+
+    timings = {}
     for boost_version in boost_versions:
         print("Starting {}".format(boost_version))
         boost_collector = BoostDependencyBuilder(
@@ -472,6 +1019,7 @@ def main(args=None) -> int:
             outputdir=ns.outputdir,
             tmppath=ns.tmppath,
             unsafe=ns.unsafe,
+            cache=cache,
         )
 
         if not ns.git_update and not boost_collector.boost_path.exists():
@@ -482,14 +1030,20 @@ def main(args=None) -> int:
             boost_collector.do_git_update()
             git_update_done = True
 
-        boost_collector.do_git_submodule_update()
+        with boost_collector.timed("submodules"):
+            boost_collector.do_git_submodule_update()
+
+        with boost_collector.timed("boostdep"):
+            boost_collector.do_install_boostdep()
 
-        boost_collector.do_install_boostdep()
+        with boost_collector.timed("dependencies"):
+            boost_collector.do_create_dependency_file()
+        timings[boost_version] = boost_collector.timings
 
-        boost_collector.do_create_dependency_file()
+    print_timings(timings)
+    cache.report()
     return 0
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
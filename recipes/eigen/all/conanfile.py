@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, tools, CMake
+from conans.errors import ConanInvalidConfiguration
 
 
 class EigenConan(ConanFile):
@@ -11,6 +12,20 @@ class EigenConan(ConanFile):
     license = "MPL-2.0"
     topics = ("eigen", "algebra", "linear-algebra", "vector", "numerical")
     settings = "os", "compiler", "build_type", "arch"
+    options = {
+        "with_blas": [True, False],
+        "with_lapacke": [True, False],
+        "max_align_bytes": ["default", "0", "16", "32", "64", "128"],
+        "vectorize": [True, False],
+        "unaligned_vectorize": [True, False]
+    }
+    default_options = {
+        "with_blas": False,
+        "with_lapacke": False,
+        "max_align_bytes": "default",
+        "vectorize": True,
+        "unaligned_vectorize": True
+    }
     exports_sources = ["patches/*"]
     no_copy_source = True
 
@@ -18,6 +33,18 @@ class EigenConan(ConanFile):
     def _source_subfolder(self):
         return "source_subfolder"
 
+    def configure(self):
+        if self.options.with_lapacke:
+            if not self.options.with_blas:
+                raise ConanInvalidConfiguration("with_lapacke requires with_blas")
+            self.options["openblas"].build_lapack = True
+        if not self.options.vectorize:
+            del self.options.unaligned_vectorize
+
+    def requirements(self):
+        if self.options.with_blas:
+            self.requires("openblas/0.3.12")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         os.rename("eigen-{}".format(self.version), self._source_subfolder)
@@ -46,3 +73,14 @@ class EigenConan(ConanFile):
         self.cpp_info.components["eigen3"].includedirs = [os.path.join("include", "eigen3")]
         if self.settings.os == "Linux":
             self.cpp_info.components["eigen3"].system_libs = ["m"]
+        if self.options.with_blas:
+            self.cpp_info.components["eigen3"].requires = ["openblas::openblas"]
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_BLAS")
+        if self.options.with_lapacke:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_USE_LAPACKE")
+        if self.options.max_align_bytes != "default":
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_MAX_ALIGN_BYTES={}".format(self.options.max_align_bytes))
+        if not self.options.vectorize:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_DONT_VECTORIZE")
+        elif not self.options.unaligned_vectorize:
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_UNALIGNED_VECTORIZE=0")
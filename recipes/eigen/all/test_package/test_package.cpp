@@ -1,7 +1,23 @@
+#include <chrono>
 #include <iostream>
 #include <Eigen/Core>
 #include <unsupported/Eigen/MatrixFunctions>
 
+// Time a dense matrix product: it is handed to ?gemm when EIGEN_USE_BLAS is defined
+static void gemm_benchmark(int n, int repeat)
+{
+    Eigen::MatrixXd A = Eigen::MatrixXd::Random(n, n);
+    Eigen::MatrixXd B = Eigen::MatrixXd::Random(n, n);
+    Eigen::MatrixXd C(n, n);
+
+    auto const start = std::chrono::steady_clock::now();
+    for (int i = 0; i < repeat; ++i) {
+        C.noalias() = A * B;
+    }
+    std::chrono::duration<double> const elapsed = std::chrono::steady_clock::now() - start;
+    double const gflops = 2.0 * n * n * n * repeat / elapsed.count() * 1e-9;
+    std::cout << "gemm " << n << "x" << n << ": " << gflops << " GFLOP/s (C(0,0)=" << C(0, 0) << ")" << std::endl;
+}
 
 int main(void)
 {
@@ -12,5 +28,15 @@ int main(void)
     std::cout << "A =\n" << A << '\n' <<std::endl;
     std::cout << "A(2..3,:) =\n" << A.middleRows(2, 2) << std::endl;
 
+#ifdef EIGEN_USE_BLAS
+    std::cout << "\nBLAS backend: enabled" << std::endl;
+#else
+    std::cout << "\nBLAS backend: disabled" << std::endl;
+#endif
+    std::cout << "SIMD instruction sets: " << Eigen::SimdInstructionSetsInUse() << std::endl;
+    gemm_benchmark(64, 200);
+    gemm_benchmark(256, 20);
+    gemm_benchmark(512, 4);
+
     return 0;
 }
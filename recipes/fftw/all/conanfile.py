@@ -19,13 +19,21 @@ class FFTWConan(ConanFile):
                "precision": ["double", "single", "longdouble"],
                "openmp": [True, False],
                "threads": [True, False],
-               "combinedthreads": [True, False]}
+               "combinedthreads": [True, False],
+               "simd_sse": [True, False],
+               "simd_sse2": [True, False],
+               "simd_avx": [True, False],
+               "simd_avx2": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
                        "precision": "double",
                        "openmp": False,
                        "threads": False,
-                       "combinedthreads": False}
+                       "combinedthreads": False,
+                       "simd_sse": False,
+                       "simd_sse2": False,
+                       "simd_avx": False,
+                       "simd_avx2": False}
 
     _cmake = None
 
@@ -37,9 +45,20 @@ class FFTWConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    @property
+    def _simd_options(self):
+        return ("sse", "sse2", "avx", "avx2")
+
+    @property
+    def _enabled_simd(self):
+        return [simd for simd in self._simd_options if self.options.get_safe("simd_" + simd)]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            for simd in self._simd_options:
+                self.options.remove("simd_" + simd)
 
     def configure(self):
         if self.options.shared:
@@ -53,6 +72,11 @@ class FFTWConan(ConanFile):
                 raise ConanInvalidConfiguration("Shared fftw with openmp can't be built on Windows")
             if self.options.threads and not self.options.combinedthreads:
                 raise ConanInvalidConfiguration("Shared fftw with threads and not combinedthreads can't be built on Windows")
+        if self._enabled_simd:
+            if self.options.precision == "longdouble":
+                raise ConanInvalidConfiguration("fftw has no SIMD codelets for long double precision")
+            if self.options.simd_sse and self.options.precision != "single":
+                raise ConanInvalidConfiguration("fftw SSE codelets are only available in single precision (use simd_sse2 for double precision)")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -69,6 +93,8 @@ class FFTWConan(ConanFile):
         self._cmake.definitions["WITH_COMBINED_THREADS"] = self.options.get_safe("combinedthreads", False)
         self._cmake.definitions["ENABLE_FLOAT"] = self.options.precision == "single"
         self._cmake.definitions["ENABLE_LONG_DOUBLE"] = self.options.precision == "longdouble"
+        for simd in self._simd_options:
+            self._cmake.definitions["ENABLE_" + simd.upper()] = self.options.get_safe("simd_" + simd, False)
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -86,6 +112,7 @@ class FFTWConan(ConanFile):
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
 
     def package_info(self):
+        self.user_info.simd = ",".join(self._enabled_simd)
         prec_suffix = self._prec_suffix[str(self.options.precision)]
         cmake_config_name = "FFTW3" + prec_suffix
         cmake_namespace = "FFTW3"
@@ -15,6 +15,7 @@ class TestPackageConan(ConanFile):
         cmake.build()
 
     def test(self):
+        self.output.info("fftw SIMD codelets: {}".format(self.deps_user_info["fftw"].simd or "none"))
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
@@ -1,5 +1,8 @@
 #include "fftw3.h"
 
+#include <chrono>
+#include <cstdio>
+
 // switch API to match the precision option (fftw_|fftwf_|fftwl)
 #if defined(ENABLE_SINGLE_PRECISION)
 typedef float real_t;
@@ -12,15 +15,44 @@ typedef double real_t;
 #define FFTW_MANGLE(name) FFTW_MANGLE_DOUBLE(name)
 #endif
 
-int main() {
-    long size = 256;
+static void print_plan_for(long size) {
     real_t* input = FFTW_MANGLE(alloc_real)(size);
-    FFTW_MANGLE(complex)* output = FFTW_MANGLE(alloc_complex)(size);
-    FFTW_MANGLE(plan) plan = (FFTW_MANGLE(plan_dft_r2c_1d)(
-          size, input, output, FFTW_ESTIMATE));
-    FFTW_MANGLE(execute)(plan);
+    FFTW_MANGLE(complex)* output = FFTW_MANGLE(alloc_complex)(size / 2 + 1);
+    FFTW_MANGLE(plan) plan = FFTW_MANGLE(plan_dft_r2c_1d)(size, input, output, FFTW_MEASURE);
+    // the plan lists the codelets in use, SIMD codelets are suffixed with their instruction set (e.g. "_avx")
+    FFTW_MANGLE(print_plan)(plan);
+    std::printf("\n");
     FFTW_MANGLE(destroy_plan)(plan);
     FFTW_MANGLE(free)(output);
     FFTW_MANGLE(free)(input);
+}
+
+static double time_execute(long size, int repeat) {
+    real_t* input = FFTW_MANGLE(alloc_real)(size);
+    FFTW_MANGLE(complex)* output = FFTW_MANGLE(alloc_complex)(size / 2 + 1);
+    FFTW_MANGLE(plan) plan = FFTW_MANGLE(plan_dft_r2c_1d)(size, input, output, FFTW_MEASURE);
+    // FFTW_MEASURE overwrites the input array, so fill it after planning
+    for (long i = 0; i < size; ++i) {
+        input[i] = static_cast<real_t>(i % 17);
+    }
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < repeat; ++i) {
+        FFTW_MANGLE(execute)(plan);
+    }
+    const std::chrono::duration<double, std::micro> elapsed = std::chrono::steady_clock::now() - start;
+    FFTW_MANGLE(destroy_plan)(plan);
+    FFTW_MANGLE(free)(output);
+    FFTW_MANGLE(free)(input);
+    return elapsed.count() / repeat;
+}
+
+int main() {
+    const long sizes[] = {64, 256, 1024, 4096, 16384};
+    print_plan_for(256);
+    std::printf("%8s %14s\n", "size", "us/execute");
+    for (long size : sizes) {
+        const int repeat = static_cast<int>(1048576 / size);
+        std::printf("%8ld %14.3f\n", size, time_execute(size, repeat));
+    }
     return 0;
 }
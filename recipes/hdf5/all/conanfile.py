@@ -1,8 +1,9 @@
 import glob
 import os
+import re
 
 from conans import ConanFile, CMake, tools
-from conans.errors import ConanInvalidConfiguration
+from conans.errors import ConanException, ConanInvalidConfiguration
 
 class Hdf5Conan(ConanFile):
     name = "hdf5"
@@ -11,7 +12,7 @@ class Hdf5Conan(ConanFile):
     topics = ("conan", "hdf5", "hdf", "data")
     homepage = "https://portal.hdfgroup.org/display/HDF5/HDF5"
     url = "https://github.com/conan-io/conan-center-index"
-    exports_sources = ["CMakeLists.txt", "patches/**"]
+    exports_sources = ["CMakeLists.txt", "patches/**", "filters/*"]
     generators = "cmake"
     settings = "os", "arch", "compiler", "build_type"
     options = {
@@ -22,7 +23,13 @@ class Hdf5Conan(ConanFile):
         "threadsafe": [True, False],
         "with_zlib": [True, False],
         "szip_support": [None, "with_libaec", "with_szip"],
-        "szip_encoding": [True, False]
+        "szip_encoding": [True, False],
+        "direct_vfd": [True, False],
+        "chunk_cache_nslots": "ANY",
+        "chunk_cache_nbytes": "ANY",
+        "with_zstd_filter": [True, False],
+        "with_lz4_filter": [True, False],
+        "with_blosc_filter": [True, False]
     }
     default_options = {
         "shared": False,
@@ -32,7 +39,13 @@ class Hdf5Conan(ConanFile):
         "threadsafe": False,
         "with_zlib": True,
         "szip_support": None,
-        "szip_encoding": False
+        "szip_encoding": False,
+        "direct_vfd": False,
+        "chunk_cache_nslots": "",
+        "chunk_cache_nbytes": "",
+        "with_zstd_filter": False,
+        "with_lz4_filter": False,
+        "with_blosc_filter": False
     }
 
     _cmake = None
@@ -45,9 +58,24 @@ class Hdf5Conan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    @property
+    def _filter_plugins(self):
+        return {
+            "zstd": "with_zstd_filter",
+            "lz4": "with_lz4_filter",
+            "blosc": "with_blosc_filter",
+        }
+
+    @property
+    def _enabled_filter_plugins(self):
+        return [name for name, option in self._filter_plugins.items() if self.options.get_safe(option)]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux":
+            # O_DIRECT is only available on Linux
+            del self.options.direct_vfd
 
     def configure(self):
         if not self.options.enable_cxx:
@@ -61,6 +89,13 @@ class Hdf5Conan(ConanFile):
              self.options.szip_encoding and \
              not self.options["szip"].enable_encoding:
             raise ConanInvalidConfiguration("encoding must be enabled in szip dependency (szip:enable_encoding=True)")
+        for option in ["chunk_cache_nslots", "chunk_cache_nbytes"]:
+            value = str(self.options.get_safe(option))
+            if value and (not value.isdigit() or int(value) == 0):
+                raise ConanInvalidConfiguration("{} must be a positive integer".format(option))
+        if self.options.with_blosc_filter and not self.options.shared:
+            # the blosc plugin calls the HDF5 API, it must share the library with the application
+            raise ConanInvalidConfiguration("with_blosc_filter requires shared=True")
 
     def requirements(self):
         if self.options.with_zlib:
@@ -69,6 +104,12 @@ class Hdf5Conan(ConanFile):
             self.requires("libaec/1.0.4")
         elif self.options.szip_support == "with_szip":
             self.requires("szip/2.1.1")
+        if self.options.with_zstd_filter:
+            self.requires("zstd/1.4.5")
+        if self.options.with_lz4_filter:
+            self.requires("lz4/1.9.2")
+        if self.options.with_blosc_filter:
+            self.requires("c-blosc/1.20.1")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -86,6 +127,18 @@ class Hdf5Conan(ConanFile):
         # Do not force PIC
         tools.replace_in_file(os.path.join(self._source_subfolder, "CMakeLists.txt"),
                               "set (CMAKE_POSITION_INDEPENDENT_CODE ON)", "")
+        # Default raw data chunk cache of every file access property list
+        h5pfapl = os.path.join(self._source_subfolder, "src", "H5Pfapl.c")
+        content = tools.load(h5pfapl)
+        for option, macro in [("chunk_cache_nslots", "H5F_ACS_DATA_CACHE_NUM_SLOTS_DEF"),
+                              ("chunk_cache_nbytes", "H5F_ACS_DATA_CACHE_BYTE_SIZE_DEF")]:
+            value = self.options.get_safe(option)
+            if not value:
+                continue
+            content, count = re.subn(r"(#define {}[ \t]+).*".format(macro), r"\g<1>{}".format(value), content)
+            if not count:
+                raise ConanException("{} not found in H5Pfapl.c, {} can't be applied".format(macro, option))
+        tools.save(h5pfapl, content)
 
     def _configure_cmake(self):
         if self._cmake:
@@ -111,6 +164,7 @@ class Hdf5Conan(ConanFile):
         if self.settings.build_type == "Debug":
             self._cmake.definitions["HDF5_ENABLE_INSTRUMENT"] = False  # Option?
         self._cmake.definitions["HDF5_ENABLE_PARALLEL"] = False
+        self._cmake.definitions["HDF5_ENABLE_DIRECT_VFD"] = self.options.get_safe("direct_vfd", False)
         self._cmake.definitions["HDF5_ENABLE_Z_LIB_SUPPORT"] = self.options.with_zlib
         self._cmake.definitions["HDF5_ENABLE_SZIP_SUPPORT"] = bool(self.options.szip_support)
         if bool(self.options.szip_support):
@@ -128,6 +182,8 @@ class Hdf5Conan(ConanFile):
         self._cmake.definitions["HDF5_BUILD_CPP_LIB"] = self.options.enable_cxx
         if tools.Version(self.version) >= "1.10.0":
             self._cmake.definitions["HDF5_BUILD_JAVA"] = False
+        # Filter plugins built by the wrapper CMakeLists (not HDF5_ENABLE_PLUGIN_SUPPORT, which downloads hdf5_plugins)
+        self._cmake.definitions["CONAN_HDF5_FILTER_PLUGINS"] = ";".join(self._enabled_filter_plugins)
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -155,6 +211,10 @@ class Hdf5Conan(ConanFile):
             self.cpp_info.system_libs.extend(["dl", "m"])
             if self.options.get_safe("threadsafe"):
                 self.cpp_info.system_libs.append("pthread")
+        if self._enabled_filter_plugins:
+            plugin_path = os.path.join(self.package_folder, "lib", "plugin")
+            self.output.info("Setting HDF5_PLUGIN_PATH environment variable: {}".format(plugin_path))
+            self.env_info.HDF5_PLUGIN_PATH = plugin_path
 
     def _get_ordered_libs(self):
         libs = ["hdf5"]
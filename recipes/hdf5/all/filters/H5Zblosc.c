@@ -0,0 +1,114 @@
+/*
+ * HDF5 filter plugin for Blosc, registered filter id 32001.
+ * cd_values[0..3] are filled by set_local (filter revision, blosc format,
+ * type size, chunk size); callers pass cd_values[4] (compression level),
+ * cd_values[5] (shuffle) and cd_values[6] (compressor code), like with the
+ * reference hdf5-blosc filter.
+ */
+#include <stdlib.h>
+
+#include "hdf5.h"
+#include "H5PLextern.h"
+
+#include <blosc.h>
+
+#define H5Z_FILTER_BLOSC 32001
+#define H5Z_FILTER_BLOSC_VERSION 2
+#define H5Z_FILTER_BLOSC_MAX_NDIMS 32
+
+static herr_t H5Z_blosc_set_local(hid_t dcpl, hid_t type, hid_t space)
+{
+    unsigned int flags;
+    size_t nelements = 8;
+    unsigned int values[8] = {0};
+    hsize_t chunkdims[H5Z_FILTER_BLOSC_MAX_NDIMS];
+    size_t typesize, basetypesize, chunk_size;
+    int ndims, i;
+
+    (void)space;
+    if (H5Pget_filter_by_id2(dcpl, H5Z_FILTER_BLOSC, &flags, &nelements, values, 0, NULL, NULL) < 0)
+        return -1;
+    if (nelements < 4)
+        nelements = 4;
+
+    ndims = H5Pget_chunk(dcpl, H5Z_FILTER_BLOSC_MAX_NDIMS, chunkdims);
+    if (ndims < 0)
+        return -1;
+    typesize = H5Tget_size(type);
+    if (typesize == 0)
+        return -1;
+    basetypesize = typesize;
+    if (H5Tget_class(type) == H5T_ARRAY) {
+        hid_t const super_type = H5Tget_super(type);
+        basetypesize = H5Tget_size(super_type);
+        H5Tclose(super_type);
+    }
+    /* blosc can't shuffle larger elements: treat them as bytes */
+    if (basetypesize > BLOSC_MAX_TYPESIZE)
+        basetypesize = 1;
+    chunk_size = typesize;
+    for (i = 0; i < ndims; ++i)
+        chunk_size *= chunkdims[i];
+
+    values[0] = H5Z_FILTER_BLOSC_VERSION;
+    values[1] = BLOSC_VERSION_FORMAT;
+    values[2] = (unsigned int)basetypesize;
+    values[3] = (unsigned int)chunk_size;
+    if (H5Pmodify_filter(dcpl, H5Z_FILTER_BLOSC, flags, nelements, values) < 0)
+        return -1;
+    return 1;
+}
+
+static size_t H5Z_filter_blosc(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                               size_t nbytes, size_t *buf_size, void **buf)
+{
+    void *outbuf;
+    size_t outbuf_size;
+    int status;
+
+    if (flags & H5Z_FLAG_REVERSE) {
+        size_t cbytes, blocksize;
+        blosc_cbuffer_sizes(*buf, &outbuf_size, &cbytes, &blocksize);
+        outbuf = malloc(outbuf_size);
+        if (outbuf == NULL)
+            return 0;
+        status = blosc_decompress_ctx(*buf, outbuf, outbuf_size, 1);
+    } else {
+        size_t const typesize = cd_nelmts > 2 && cd_values[2] > 0 ? cd_values[2] : 1;
+        int const clevel = cd_nelmts > 4 ? (int)cd_values[4] : 5;
+        int const doshuffle = cd_nelmts > 5 ? (int)cd_values[5] : BLOSC_SHUFFLE;
+        int const compcode = cd_nelmts > 6 ? (int)cd_values[6] : BLOSC_BLOSCLZ;
+        const char *compname = NULL;
+        if (blosc_compcode_to_compname(compcode, &compname) < 0)
+            return 0;
+        /* incompressible chunks make the filter fail: HDF5 stores them as is when the filter is optional */
+        outbuf_size = nbytes;
+        outbuf = malloc(outbuf_size);
+        if (outbuf == NULL)
+            return 0;
+        status = blosc_compress_ctx(clevel, doshuffle, typesize, nbytes, *buf, outbuf, outbuf_size, compname, 0, 1);
+    }
+
+    if (status <= 0) {
+        free(outbuf);
+        return 0;
+    }
+    free(*buf);
+    *buf = outbuf;
+    *buf_size = outbuf_size;
+    return (size_t)status;
+}
+
+static const H5Z_class2_t H5Z_BLOSC[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_BLOSC,
+    1, /* encoder_present */
+    1, /* decoder_present */
+    "blosc",
+    NULL, /* can_apply */
+    (H5Z_set_local_func_t)H5Z_blosc_set_local,
+    (H5Z_func_t)H5Z_filter_blosc
+}};
+
+H5PL_type_t H5PLget_plugin_type(void) { return H5PL_TYPE_FILTER; }
+const void *H5PLget_plugin_info(void) { return H5Z_BLOSC; }
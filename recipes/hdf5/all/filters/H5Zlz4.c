@@ -0,0 +1,150 @@
+/*
+ * HDF5 filter plugin for LZ4, registered filter id 32004.
+ * cd_values[0] (optional): block size in bytes (default 1 GiB).
+ *
+ * The stream layout matches the reference LZ4 filter:
+ * original size (8 bytes, big endian), block size (4 bytes, big endian),
+ * then for every block its compressed size (4 bytes, big endian) and its data.
+ * Blocks that do not compress are stored as is.
+ */
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "H5PLextern.h"
+
+#include <lz4.h>
+
+#define H5Z_FILTER_LZ4 32004
+#define LZ4_FILTER_DEFAULT_BLOCK_SIZE (1U << 30)
+#define LZ4_FILTER_HEADER_SIZE 12
+
+static void store_be(uint8_t *dst, uint64_t value, int bytes)
+{
+    int i;
+    for (i = bytes - 1; i >= 0; --i) {
+        dst[i] = (uint8_t)(value & 0xff);
+        value >>= 8;
+    }
+}
+
+static uint64_t load_be(const uint8_t *src, int bytes)
+{
+    uint64_t value = 0;
+    int i;
+    for (i = 0; i < bytes; ++i)
+        value = (value << 8) | src[i];
+    return value;
+}
+
+static size_t lz4_compress_chunk(size_t cd_nelmts, const unsigned int cd_values[], size_t nbytes,
+                                 size_t *buf_size, void **buf)
+{
+    const uint8_t *rpos = (const uint8_t *)*buf;
+    size_t block_size = cd_nelmts > 0 && cd_values[0] > 0 ? cd_values[0] : LZ4_FILTER_DEFAULT_BLOCK_SIZE;
+    size_t n_blocks, outbuf_size, offset;
+    uint8_t *outbuf, *wpos;
+
+    if (nbytes == 0 || block_size > (size_t)LZ4_MAX_INPUT_SIZE)
+        return 0;
+    if (block_size > nbytes)
+        block_size = nbytes;
+    n_blocks = (nbytes - 1) / block_size + 1;
+    outbuf_size = LZ4_FILTER_HEADER_SIZE + n_blocks * (4 + (size_t)LZ4_compressBound((int)block_size));
+    outbuf = (uint8_t *)malloc(outbuf_size);
+    if (outbuf == NULL)
+        return 0;
+
+    store_be(outbuf, nbytes, 8);
+    store_be(outbuf + 8, block_size, 4);
+    wpos = outbuf + LZ4_FILTER_HEADER_SIZE;
+    for (offset = 0; offset < nbytes; offset += block_size) {
+        size_t const size = nbytes - offset < block_size ? nbytes - offset : block_size;
+        int compressed = LZ4_compress_default((const char *)rpos + offset, (char *)wpos + 4, (int)size,
+                                              LZ4_compressBound((int)size));
+        if (compressed <= 0) {
+            free(outbuf);
+            return 0;
+        }
+        if ((size_t)compressed >= size) {
+            memcpy(wpos + 4, rpos + offset, size);
+            compressed = (int)size;
+        }
+        store_be(wpos, (uint64_t)compressed, 4);
+        wpos += 4 + compressed;
+    }
+
+    free(*buf);
+    *buf = outbuf;
+    *buf_size = outbuf_size;
+    return (size_t)(wpos - outbuf);
+}
+
+static size_t lz4_decompress_chunk(size_t nbytes, size_t *buf_size, void **buf)
+{
+    const uint8_t *rpos = (const uint8_t *)*buf;
+    const uint8_t *end = rpos + nbytes;
+    size_t orig_size, block_size, decompressed = 0;
+    uint8_t *outbuf;
+
+    if (nbytes < LZ4_FILTER_HEADER_SIZE)
+        return 0;
+    orig_size = (size_t)load_be(rpos, 8);
+    block_size = (size_t)load_be(rpos + 8, 4);
+    if (block_size > orig_size)
+        block_size = orig_size;
+    rpos += LZ4_FILTER_HEADER_SIZE;
+
+    outbuf = (uint8_t *)malloc(orig_size);
+    if (outbuf == NULL)
+        return 0;
+    while (decompressed < orig_size) {
+        size_t compressed, size;
+        if (end - rpos < 4)
+            goto error;
+        compressed = (size_t)load_be(rpos, 4);
+        rpos += 4;
+        size = orig_size - decompressed < block_size ? orig_size - decompressed : block_size;
+        if ((size_t)(end - rpos) < compressed)
+            goto error;
+        if (compressed == size) {
+            memcpy(outbuf + decompressed, rpos, size);
+        } else if (LZ4_decompress_safe((const char *)rpos, (char *)outbuf + decompressed,
+                                       (int)compressed, (int)size) != (int)size) {
+            goto error;
+        }
+        rpos += compressed;
+        decompressed += size;
+    }
+
+    free(*buf);
+    *buf = outbuf;
+    *buf_size = orig_size;
+    return orig_size;
+
+error:
+    free(outbuf);
+    return 0;
+}
+
+static size_t H5Z_filter_lz4(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                             size_t nbytes, size_t *buf_size, void **buf)
+{
+    if (flags & H5Z_FLAG_REVERSE)
+        return lz4_decompress_chunk(nbytes, buf_size, buf);
+    return lz4_compress_chunk(cd_nelmts, cd_values, nbytes, buf_size, buf);
+}
+
+static const H5Z_class2_t H5Z_LZ4[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_LZ4,
+    1, /* encoder_present */
+    1, /* decoder_present */
+    "HDF5 lz4 filter; see http://www.hdfgroup.org/services/contributions.html",
+    NULL, /* can_apply */
+    NULL, /* set_local */
+    (H5Z_func_t)H5Z_filter_lz4
+}};
+
+H5PL_type_t H5PLget_plugin_type(void) { return H5PL_TYPE_FILTER; }
+const void *H5PLget_plugin_info(void) { return H5Z_LZ4; }
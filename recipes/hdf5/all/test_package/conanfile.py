@@ -9,6 +9,9 @@ class Hdf5TestConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["WITH_ZSTD_FILTER"] = self.options["hdf5"].with_zstd_filter
+        cmake.definitions["WITH_LZ4_FILTER"] = self.options["hdf5"].with_lz4_filter
+        cmake.definitions["WITH_BLOSC_FILTER"] = self.options["hdf5"].with_blosc_filter
         cmake.configure()
         cmake.build()
 
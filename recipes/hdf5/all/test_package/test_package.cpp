@@ -1,9 +1,80 @@
 #include <H5Cpp.h>
 
+#include <cstdio>
+#include <vector>
+
+// Write and read back a chunked float dataset through a non-deflate filter pipeline
+static bool test_chunked_dataset(H5::H5File &file, const char *name, H5Z_filter_t filter, size_t cd_nelmts, const unsigned int cd_values[])
+{
+    const hsize_t rows = 256, cols = 512;
+    hsize_t dimensions[] = {rows, cols};
+    hsize_t chunk[] = {64, cols};
+    std::vector<float> data(rows * cols);
+    for (size_t i = 0; i < data.size(); ++i)
+        data[i] = static_cast<float>(i % cols) * 0.5f;
+
+    H5::DSetCreatPropList plist;
+    plist.setChunk(2, chunk);
+    plist.setShuffle();
+    if (filter != H5Z_FILTER_NONE)
+        plist.setFilter(filter, H5Z_FLAG_MANDATORY, cd_nelmts, cd_values);
+    plist.setFletcher32();
+
+    H5::DataSpace dataspace(2, dimensions);
+    H5::DataSet dataset = file.createDataSet(name, H5::PredType::NATIVE_FLOAT, dataspace, plist);
+    dataset.write(data.data(), H5::PredType::NATIVE_FLOAT);
+
+    std::vector<float> read_back(data.size());
+    dataset.read(read_back.data(), H5::PredType::NATIVE_FLOAT);
+    const bool ok = read_back == data;
+    std::printf("%s: stored %llu bytes for %llu, round-trip %s\n", name,
+                static_cast<unsigned long long>(dataset.getStorageSize()),
+                static_cast<unsigned long long>(data.size() * sizeof(float)), ok ? "ok" : "FAILED");
+    return ok;
+}
+
 int main()
 {
     hsize_t dimensions[] = {4, 6};  
 	H5::H5File file("dataset.h5", H5F_ACC_TRUNC);
 	H5::DataSpace dataspace(2, dimensions);
 	H5::DataSet dataset = file.createDataSet("dataset", H5::PredType::STD_I32BE, dataspace);
+
+    bool ok = test_chunked_dataset(file, "shuffle_fletcher32", H5Z_FILTER_NONE, 0, NULL);
+
+    // Filter plugins, found through HDF5_PLUGIN_PATH when built by the recipe
+    const struct {
+        const char *name;
+        H5Z_filter_t id;
+        size_t cd_nelmts;
+        unsigned int cd_values[7];
+        bool enabled;
+    } plugins[] = {
+#if defined(WITH_ZSTD_FILTER)
+        {"zstd", 32015, 1, {3}, true},
+#else
+        {"zstd", 32015, 1, {3}, false},
+#endif
+#if defined(WITH_LZ4_FILTER)
+        {"lz4", 32004, 0, {0}, true},
+#else
+        {"lz4", 32004, 0, {0}, false},
+#endif
+#if defined(WITH_BLOSC_FILTER)
+        {"blosc_lz4", 32001, 7, {0, 0, 0, 0, 5, 1, 1}, true},
+#else
+        {"blosc_lz4", 32001, 7, {0, 0, 0, 0, 5, 1, 1}, false},
+#endif
+    };
+    for (size_t i = 0; i < sizeof(plugins) / sizeof(plugins[0]); ++i) {
+        if (H5Zfilter_avail(plugins[i].id) > 0) {
+            ok = test_chunked_dataset(file, plugins[i].name, plugins[i].id, plugins[i].cd_nelmts, plugins[i].cd_values) && ok;
+        } else if (plugins[i].enabled) {
+            std::printf("%s: filter plugin enabled in the package but not available\n", plugins[i].name);
+            ok = false;
+        } else {
+            std::printf("%s: filter plugin not available\n", plugins[i].name);
+        }
+    }
+    return ok ? 0 : 1;
 }
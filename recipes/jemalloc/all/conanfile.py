@@ -2,6 +2,7 @@ from conans import AutoToolsBuildEnvironment, ConanFile, MSBuild, tools
 from conans.errors import ConanInvalidConfiguration
 from conans.client.tools import msvs_toolset
 import os
+import re
 import shutil
 import string
 
@@ -27,6 +28,13 @@ class JemallocConan(ConanFile):
         "enable_debug_logging": [True, False],
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
+        "enable_prof": [True, False],
+        "prof_backend": ["libgcc", "libunwind", "gcc"],
+        "enable_stats": [True, False],
+        "enable_cache_oblivious": [True, False],
+        "lg_page": "ANY",
+        "lg_hugepage": "ANY",
+        "malloc_conf": "ANY",
     }
     default_options = {
         "shared": False,
@@ -41,6 +49,13 @@ class JemallocConan(ConanFile):
         "enable_debug_logging": False,
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
+        "enable_prof": False,
+        "prof_backend": "libgcc",
+        "enable_stats": True,
+        "enable_cache_oblivious": True,
+        "lg_page": "",
+        "lg_hugepage": "",
+        "malloc_conf": "",
     }
 
     _autotools = None
@@ -73,6 +88,32 @@ class JemallocConan(ConanFile):
             raise ConanInvalidConfiguration("Only Release and Debug build_types are supported")
         if self.settings.compiler == "Visual Studio" and self.settings.arch not in ("x86_64", "x86"):
             raise ConanInvalidConfiguration("Unsupported arch")
+        if self.options.enable_prof:
+            if self.settings.os == "Windows":
+                raise ConanInvalidConfiguration("jemalloc heap profiling is not supported on Windows")
+            if self.options.prof_backend == "libunwind" and self.settings.os not in ("Linux", "FreeBSD"):
+                raise ConanInvalidConfiguration("The libunwind profiling backend is only available on Linux and FreeBSD")
+        else:
+            del self.options.prof_backend
+        self._validate_lg_option("lg_page", 12, 16)
+        self._validate_lg_option("lg_hugepage", 16, 30)
+        if self.options.lg_page and self.options.lg_hugepage and \
+                int(str(self.options.lg_hugepage)) < int(str(self.options.lg_page)):
+            raise ConanInvalidConfiguration("lg_hugepage must not be smaller than lg_page")
+        if self.options.malloc_conf and \
+                not re.match(r"^[a-z0-9_]+:[^,:\s]+(,[a-z0-9_]+:[^,:\s]+)*$", str(self.options.malloc_conf)):
+            raise ConanInvalidConfiguration("malloc_conf must be a comma separated list of option:value pairs (e.g. \"background_thread:true,dirty_decay_ms:5000\")")
+
+    def _validate_lg_option(self, name, minimum, maximum):
+        value = str(self.options.get_safe(name))
+        if not value:
+            return
+        if not value.isdigit() or not minimum <= int(value) <= maximum:
+            raise ConanInvalidConfiguration("{} must be the base 2 log of the size, between {} and {}".format(name, minimum, maximum))
+
+    def requirements(self):
+        if self.options.get_safe("prof_backend") == "libunwind":
+            self.requires("libunwind/1.5.0")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -96,7 +137,23 @@ class JemallocConan(ConanFile):
             "--enable-log" if self.options.enable_debug_logging else "--disable-log",
             "--enable-initial-exec-tld" if self.options.enable_initial_exec_tls else "--disable-initial-exec-tls",
             "--enable-libdl" if self.options.enable_libdl else "--disable-libdl",
+            "--enable-prof" if self.options.enable_prof else "--disable-prof",
+            "--enable-stats" if self.options.enable_stats else "--disable-stats",
+            "--enable-cache-oblivious" if self.options.enable_cache_oblivious else "--disable-cache-oblivious",
         ]
+        if self.options.enable_prof:
+            prof_backend = str(self.options.prof_backend)
+            conf_args.extend([
+                "--enable-prof-libunwind" if prof_backend == "libunwind" else "--disable-prof-libunwind",
+                "--enable-prof-libgcc" if prof_backend == "libgcc" else "--disable-prof-libgcc",
+                "--enable-prof-gcc" if prof_backend == "gcc" else "--disable-prof-gcc",
+            ])
+        if self.options.lg_page:
+            conf_args.append("--with-lg-page={}".format(self.options.lg_page))
+        if self.options.lg_hugepage:
+            conf_args.append("--with-lg-hugepage={}".format(self.options.lg_hugepage))
+        if self.options.malloc_conf:
+            conf_args.append("--with-malloc-conf={}".format(self.options.malloc_conf))
         if self.options.shared:
             conf_args.extend(["--enable-shared", "--disable-static"])
         else:
@@ -203,4 +260,6 @@ class JemallocConan(ConanFile):
         if not self.options.shared:
             self.cpp_info.defines = ["JEMALLOC_EXPORT="]
         if self.settings.os == "Linux":
-            self.cpp_info.system_libs.extend(["dl", "pthread", "rt"])
+            if self.options.enable_libdl:
+                self.cpp_info.system_libs.append("dl")
+            self.cpp_info.system_libs.extend(["pthread", "rt"])
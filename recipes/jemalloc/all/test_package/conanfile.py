@@ -8,6 +8,7 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["TEST_PROF"] = self.options["jemalloc"].enable_prof
         cmake.configure()
         cmake.build()
 
@@ -1,6 +1,14 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdbool.h>
+#include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
+
+#ifdef TEST_PROF
+// Heap profiling must be active from startup for prof.dump to work
+const char *malloc_conf = "prof:true,prof_active:true,lg_prof_sample:0";
+#endif
 
 void
 do_something(size_t i) {
@@ -8,6 +16,50 @@ do_something(size_t i) {
         malloc(i * 100);
 }
 
+static bool
+config_enabled(const char *name) {
+        bool enabled = false;
+        size_t sz = sizeof(enabled);
+        return mallctl(name, &enabled, &sz, NULL, 0) == 0 && enabled;
+}
+
+static int
+check_stats(void) {
+        // Statistics are cached: bump the epoch to refresh them.
+        uint64_t epoch = 1;
+        size_t sz = sizeof(epoch);
+        mallctl("epoch", &epoch, &sz, &epoch, sz);
+
+        size_t allocated = 0;
+        sz = sizeof(allocated);
+        if (mallctl("stats.allocated", &allocated, &sz, NULL, 0) != 0) {
+                fprintf(stderr, "mallctl(\"stats.allocated\") failed\n");
+                return 1;
+        }
+        printf("stats.allocated: %zu\n", allocated);
+        return allocated == 0;
+}
+
+static int
+check_prof_dump(void) {
+        const char *filename = "test_package.heap";
+        if (mallctl("prof.dump", NULL, NULL, &filename, sizeof(filename)) != 0) {
+                fprintf(stderr, "mallctl(\"prof.dump\") failed\n");
+                return 1;
+        }
+        FILE *f = fopen(filename, "r");
+        if (f == NULL) {
+                fprintf(stderr, "%s was not written\n", filename);
+                return 1;
+        }
+        char header[16] = {0};
+        size_t read = fread(header, 1, sizeof(header) - 1, f);
+        fclose(f);
+        printf("prof.dump: %s (%s)\n", filename, read ? header : "empty");
+        // Profiles start with a "heap_v2/<sample interval>" line
+        return strncmp(header, "heap_v2/", 8) != 0;
+}
+
 int
 main(int argc, char **argv) {
         for (size_t i = 0; i < 1000; i++) {
@@ -17,5 +69,12 @@ main(int argc, char **argv) {
         // Dump allocator statistics to stderr.
         malloc_stats_print(NULL, NULL, NULL);
 
-        return 0;
+        int result = 0;
+        if (config_enabled("config.stats")) {
+                result |= check_stats();
+        }
+        if (config_enabled("config.prof")) {
+                result |= check_prof_dump();
+        }
+        return result;
 }
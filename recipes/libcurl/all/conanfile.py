@@ -36,7 +36,8 @@ class LibcurlConan(ConanFile):
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
-        "with_c_ares": [True, False],
+        "with_c_ares": [True, False, "deprecated"],
+        "resolver": ["sync", "threaded", "c-ares"],
     }
     default_options = {
         "shared": False,
@@ -57,7 +58,8 @@ class LibcurlConan(ConanFile):
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
-        "with_c_ares": False,
+        "with_c_ares": "deprecated",
+        "resolver": "threaded",
     }
 
     _autotools = None
@@ -124,6 +126,12 @@ class LibcurlConan(ConanFile):
                     self.options.with_ssl = "wolfssl"
                 else:
                     self.options.with_ssl = False
+        if self.options.with_c_ares != "deprecated":
+            self.output.warn("with_c_ares option is deprecated. Use resolver option instead.")
+            if self.options.with_c_ares == True:
+                self.options.resolver = "c-ares"
+            elif self.options.resolver == "c-ares":
+                self.options.resolver = "threaded"
         # ===============================
 
         if self.options.with_ssl == "schannel" and self.settings.os != "Windows":
@@ -155,7 +163,7 @@ class LibcurlConan(ConanFile):
             self.requires("brotli/1.0.9")
         if self.options.get_safe("with_zstd"):
             self.requires("zstd/1.4.8")
-        if self.options.with_c_ares:
+        if self.options.resolver == "c-ares":
             self.requires("c-ares/1.17.1")
 
     def package_id(self):
@@ -164,6 +172,7 @@ class LibcurlConan(ConanFile):
         del self.info.options.with_winssl
         del self.info.options.darwin_ssl
         del self.info.options.with_wolfssl
+        del self.info.options.with_c_ares
 
     def build_requirements(self):
         if self._is_mingw and tools.os_info.is_windows and not tools.get_env("CONAN_BASH_PATH") and \
@@ -236,8 +245,8 @@ class LibcurlConan(ConanFile):
             "--enable-static={}".format(yes_no(not self.options.shared)),
             "--enable-ldap={}".format(yes_no(self.options.with_ldap)),
             "--enable-debug={}".format(yes_no(self.settings.build_type == "Debug")),
-            "--enable-ares={}".format(yes_no(self.options.with_c_ares)),
-            "--enable-threaded-resolver={}".format(yes_no(self.options.with_c_ares)),
+            "--enable-ares={}".format(yes_no(self.options.resolver == "c-ares")),
+            "--enable-threaded-resolver={}".format(yes_no(self.options.resolver == "threaded")),
         ]
         if self.options.with_ssl == "openssl":
             params.append("--with-ssl={}".format(tools.unix_path(self.deps_cpp_info["openssl"].rootpath)))
@@ -271,7 +280,6 @@ class LibcurlConan(ConanFile):
             if self.settings.os == "Linux" and "arm" in self.settings.arch:
                 params.append("--host=%s" % self._get_linux_arm_host())
             elif self.settings.os == "iOS":
-                params.append("--enable-threaded-resolver")
                 params.append("--disable-verbose")
             elif self.settings.os == "Android":
                 pass # this just works, conan is great!
@@ -485,7 +493,8 @@ class LibcurlConan(ConanFile):
         if self._has_zstd_option:
             self._cmake.definitions["CURL_ZSTD"] = self.options.with_zstd
         self._cmake.definitions["CMAKE_USE_LIBSSH2"] = self.options.with_libssh2
-        self._cmake.definitions["ENABLE_ARES"] = self.options.with_c_ares
+        self._cmake.definitions["ENABLE_ARES"] = self.options.resolver == "c-ares"
+        self._cmake.definitions["ENABLE_THREADED_RESOLVER"] = self.options.resolver == "threaded"
 
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
@@ -579,5 +588,5 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("brotli::brotli")
         if self.options.get_safe("with_zstd"):
             self.cpp_info.components["curl"].requires.append("zstd::zstd")
-        if self.options.with_c_ares:
+        if self.options.resolver == "c-ares":
             self.cpp_info.components["curl"].requires.append("c-ares::c-ares")
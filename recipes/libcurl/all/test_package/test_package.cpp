@@ -15,6 +15,7 @@ int main(void)
     printf("%s ", *proto);
   }
   printf("\nversion: %s\nssl version: %s\nfeatures: %d\n", id->version, id->ssl_version, id->features);
+  printf("resolver: %s\n", (id->features & CURL_VERSION_ASYNCHDNS) ? (id->ares ? "c-ares" : "threaded") : "sync");
 
   curl = curl_easy_init();
   if(curl) {
@@ -15,11 +15,17 @@ class LibeventConan(ConanFile):
     options = {"shared": [True, False],
                "fPIC": [True, False],
                "with_openssl": [True, False],
-               "disable_threads": [True, False]}
+               "disable_threads": [True, False],
+               "disable_debug_mode": [True, False, "auto"],
+               "disable_mm_replacement": [True, False],
+               "build_bench": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
                        "with_openssl": True,
-                       "disable_threads": False}
+                       "disable_threads": False,
+                       "disable_debug_mode": "auto",
+                       "disable_mm_replacement": False,
+                       "build_bench": False}
     generators = "cmake", "cmake_find_package"
     short_paths = True
 
@@ -33,6 +39,10 @@ class LibeventConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    @property
+    def _bench_tools(self):
+        return ["bench", "bench_cascade", "bench_http", "bench_httpclient"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -61,10 +71,14 @@ class LibeventConan(ConanFile):
         if self.options.with_openssl:
             self._cmake.definitions["OPENSSL_ROOT_DIR"] = self.deps_cpp_info["openssl"].rootpath
         self._cmake.definitions["EVENT__LIBRARY_TYPE"] = "SHARED" if self.options.shared else "STATIC"
-        self._cmake.definitions["EVENT__DISABLE_DEBUG_MODE"] = self.settings.build_type == "Release"
+        if self.options.disable_debug_mode == "auto":
+            self._cmake.definitions["EVENT__DISABLE_DEBUG_MODE"] = self.settings.build_type == "Release"
+        else:
+            self._cmake.definitions["EVENT__DISABLE_DEBUG_MODE"] = self.options.disable_debug_mode
+        self._cmake.definitions["EVENT__DISABLE_MM_REPLACEMENT"] = self.options.disable_mm_replacement
         self._cmake.definitions["EVENT__DISABLE_OPENSSL"] = not self.options.with_openssl
         self._cmake.definitions["EVENT__DISABLE_THREAD_SUPPORT"] = self.options.disable_threads
-        self._cmake.definitions["EVENT__DISABLE_BENCHMARK"] = True
+        self._cmake.definitions["EVENT__DISABLE_BENCHMARK"] = not self.options.build_bench
         self._cmake.definitions["EVENT__DISABLE_TESTS"] = True
         self._cmake.definitions["EVENT__DISABLE_REGRESS"] = True
         self._cmake.definitions["EVENT__DISABLE_SAMPLES"] = True
@@ -84,6 +98,10 @@ class LibeventConan(ConanFile):
         self.copy("LICENSE", src=self._source_subfolder, dst="licenses")
         cmake = self._configure_cmake()
         cmake.install()
+        if self.options.build_bench:
+            for bench_tool in self._bench_tools:
+                self.copy(bench_tool, src=self._build_subfolder, dst="bin", keep_path=False)
+                self.copy("{}.exe".format(bench_tool), src=self._build_subfolder, dst="bin", keep_path=False)
         # drop pc and cmake file
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
@@ -120,3 +138,8 @@ class LibeventConan(ConanFile):
             self.cpp_info.components["pthreads"].names["pkg_config"] = "libevent_pthreads"
             self.cpp_info.components["pthreads"].libs = ["event_pthreads"]
             self.cpp_info.components["pthreads"].requires = ["core"]
+
+        if self.options.build_bench:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH env var with : {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
@@ -15,3 +15,9 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["libevent"].build_bench and self.settings.os == "Linux":
+                # libevent picks the next available backend when the preferred ones are disabled
+                for disabled_backends in [[], ["EVENT_NOEPOLL"], ["EVENT_NOEPOLL", "EVENT_NOPOLL"]]:
+                    env = dict((backend, "1") for backend in disabled_backends + ["EVENT_SHOW_METHOD"])
+                    with tools.environment_append(env):
+                        self.run("bench -n 100 -a 10 -w 100", run_environment=True)
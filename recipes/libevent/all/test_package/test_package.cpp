@@ -8,6 +8,8 @@
 #  include <arpa/inet.h>
 # endif
 #include <sys/socket.h>
+#else
+#include <winsock2.h>
 #endif
 
 #include <event2/bufferevent.h>
@@ -16,11 +18,96 @@
 #include <event2/util.h>
 #include <event2/event.h>
 
+#define PING_PONGS 10000
+
+#ifdef _WIN32
+#define SOCKET_PAIR_FAMILY AF_INET
+#else
+#define SOCKET_PAIR_FAMILY AF_UNIX
+#endif
+
+struct ping_pong {
+	evutil_socket_t fds[2];
+	int remaining;
+};
+
+static void
+on_readable(evutil_socket_t fd, short what, void *arg)
+{
+	struct ping_pong *state = (struct ping_pong *)arg;
+	char byte;
+	(void)what;
+
+	if (recv(fd, &byte, 1, 0) != 1)
+		return;
+	if (--state->remaining > 0)
+		send(fd == state->fds[0] ? state->fds[1] : state->fds[0], &byte, 1, 0);
+}
+
+/* Bounces one byte between the two ends of a socket pair with the given backend only */
+static int
+run_ping_pong(const char *method, const char **methods)
+{
+	struct event_config *config = event_config_new();
+	struct event_base *base;
+	struct event *events[2];
+	struct ping_pong state;
+	struct timeval start, end, elapsed;
+	int i;
+
+	for (i = 0; methods[i] != NULL; ++i) {
+		if (strcmp(methods[i], method) != 0)
+			event_config_avoid_method(config, methods[i]);
+	}
+	base = event_base_new_with_config(config);
+	event_config_free(config);
+	if (!base) {
+		fprintf(stderr, "Could not initialize libevent with %s!\n", method);
+		return 1;
+	}
+	if (evutil_socketpair(SOCKET_PAIR_FAMILY, SOCK_STREAM, 0, state.fds) != 0) {
+		fprintf(stderr, "Could not create socket pair!\n");
+		event_base_free(base);
+		return 1;
+	}
+	state.remaining = PING_PONGS;
+	for (i = 0; i < 2; ++i) {
+		evutil_make_socket_nonblocking(state.fds[i]);
+		events[i] = event_new(base, state.fds[i], EV_READ | EV_PERSIST, on_readable, &state);
+		event_add(events[i], NULL);
+	}
+
+	evutil_gettimeofday(&start, NULL);
+	send(state.fds[0], "x", 1, 0);
+	while (state.remaining > 0 && event_base_loop(base, EVLOOP_ONCE) == 0)
+		;
+	evutil_gettimeofday(&end, NULL);
+	evutil_timersub(&end, &start, &elapsed);
+
+	printf("%s: %d ping-pongs in %ld.%06ld s\n", event_base_get_method(base), PING_PONGS,
+	       (long)elapsed.tv_sec, (long)elapsed.tv_usec);
+
+	for (i = 0; i < 2; ++i) {
+		event_free(events[i]);
+		evutil_closesocket(state.fds[i]);
+	}
+	event_base_free(base);
+	return state.remaining == 0 ? 0 : 1;
+}
+
 int
 main(int argc, char **argv)
 {
 	struct event_base *base;
 	const char* version = event_get_version();
+	const char **methods;
+	int result = 0;
+	int i;
+
+#ifdef _WIN32
+	WSADATA wsa_data;
+	WSAStartup(0x0201, &wsa_data);
+#endif
 
 	base = event_base_new();
 	if (!base) {
@@ -31,6 +118,11 @@ main(int argc, char **argv)
 	event_base_free(base);
 
 	printf("Version %s\n", version);
+
+	methods = event_get_supported_methods();
+	for (i = 0; methods[i] != NULL; ++i)
+		result |= run_ping_pong(methods[i], methods);
+
 	printf("done\n");
-	return 0;
+	return result;
 }
@@ -21,6 +21,8 @@ class LibrdkafkaConan(ConanFile):
         "ssl": [True, False],
         "sasl": [True, False],
         "lz4": [True, False],
+        "snappy": [True, False],
+        "without_optimization": [True, False, "auto"],
     }
     default_options = {
         "shared": False,
@@ -31,6 +33,8 @@ class LibrdkafkaConan(ConanFile):
         "ssl": False,
         "sasl": False,
         "lz4": False,
+        "snappy": True,
+        "without_optimization": "auto",
     }
     generators = "cmake", "cmake_find_package"
     exports_sources = "CMakeLists.txt", "patches/**"
@@ -73,7 +77,10 @@ class LibrdkafkaConan(ConanFile):
         if self._cmake is not None:
             return self._cmake
         self._cmake = CMake(self)
-        self._cmake.definitions["WITHOUT_OPTIMIZATION"] = self.settings.build_type == "Debug"
+        if self.options.without_optimization == "auto":
+            self._cmake.definitions["WITHOUT_OPTIMIZATION"] = self.settings.build_type == "Debug"
+        else:
+            self._cmake.definitions["WITHOUT_OPTIMIZATION"] = self.options.without_optimization
         self._cmake.definitions["ENABLE_DEVEL"] = self.settings.build_type == "Debug"
         self._cmake.definitions["RDKAFKA_BUILD_STATIC"] = not self.options.shared
         self._cmake.definitions["RDKAFKA_BUILD_EXAMPLES"] = False
@@ -86,6 +93,7 @@ class LibrdkafkaConan(ConanFile):
         self._cmake.definitions["WITH_SSL"] = self.options.ssl
         self._cmake.definitions["WITH_SASL"] = self.options.sasl
         self._cmake.definitions["ENABLE_LZ4_EXT"] = self.options.lz4
+        self._cmake.definitions["WITH_SNAPPY"] = self.options.snappy
         self._cmake.configure()
         return self._cmake
 
@@ -16,3 +16,7 @@ class LibrdkafkaTestConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "PackageTest")
             self.run(bin_path, run_environment=True)
+            # opt-in producer benchmark against the in-process mock cluster (librdkafka >= 1.4.0)
+            message_count = tools.get_env("LIBRDKAFKA_TEST_PACKAGE_MESSAGES")
+            if message_count:
+                self.run("{} {}".format(bin_path, message_count), run_environment=True)
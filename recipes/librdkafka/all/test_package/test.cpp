@@ -1,11 +1,94 @@
+#include <algorithm>
+#include <chrono>
+#include <cstdlib>
 #include <iostream>
+#include <string>
+#include <vector>
 #include <librdkafka/rdkafka.h>
 
+typedef std::chrono::steady_clock bench_clock;
+
+struct DeliveryStats {
+  std::vector<double> latencies_us;
+  int failed = 0;
+};
+
+static void on_delivery(rd_kafka_t *, const rd_kafka_message_t *rkmessage, void *opaque) {
+  DeliveryStats *stats = static_cast<DeliveryStats *>(opaque);
+  if (rkmessage->err) {
+    ++stats->failed;
+    return;
+  }
+  const bench_clock::time_point *sent = static_cast<const bench_clock::time_point *>(rkmessage->_private);
+  stats->latencies_us.push_back(std::chrono::duration<double, std::micro>(bench_clock::now() - *sent).count());
+}
+
+// Produces message_count messages to an in-process mock cluster and reports throughput and p99 delivery latency
+static void produce_to_mock_cluster(const char *codec, int message_count) {
+  char errstr[512];
+  rd_kafka_conf_t *conf = rd_kafka_conf_new();
+  if (rd_kafka_conf_set(conf, "test.mock.num.brokers", "1", errstr, sizeof(errstr)) != RD_KAFKA_CONF_OK ||
+      rd_kafka_conf_set(conf, "compression.codec", codec, errstr, sizeof(errstr)) != RD_KAFKA_CONF_OK ||
+      rd_kafka_conf_set(conf, "linger.ms", "5", errstr, sizeof(errstr)) != RD_KAFKA_CONF_OK) {
+    std::cout << codec << ": skipped (" << errstr << ")" << std::endl;
+    rd_kafka_conf_destroy(conf);
+    return;
+  }
+  DeliveryStats stats;
+  stats.latencies_us.reserve(message_count);
+  rd_kafka_conf_set_dr_msg_cb(conf, on_delivery);
+  rd_kafka_conf_set_opaque(conf, &stats);
+
+  rd_kafka_t *producer = rd_kafka_new(RD_KAFKA_PRODUCER, conf, errstr, sizeof(errstr));
+  if (!producer) {
+    std::cout << codec << ": skipped (" << errstr << ")" << std::endl;
+    return;
+  }
+
+  const std::string payload = "{\"id\": 42, \"name\": \"conan-center-index\", \"tags\": [\"kafka\", \"benchmark\"]}";
+  std::vector<bench_clock::time_point> sent(message_count);
+  const bench_clock::time_point start = bench_clock::now();
+  for (int i = 0; i < message_count; ++i) {
+    sent[i] = bench_clock::now();
+    rd_kafka_resp_err_t err;
+    while ((err = rd_kafka_producev(producer,
+                                    RD_KAFKA_V_TOPIC("test_package"),
+                                    RD_KAFKA_V_VALUE(const_cast<char *>(payload.data()), payload.size()),
+                                    RD_KAFKA_V_MSGFLAGS(RD_KAFKA_MSG_F_COPY),
+                                    RD_KAFKA_V_OPAQUE(&sent[i]),
+                                    RD_KAFKA_V_END)) == RD_KAFKA_RESP_ERR__QUEUE_FULL) {
+      rd_kafka_poll(producer, 10);
+    }
+    if (err) {
+      ++stats.failed;
+    }
+    rd_kafka_poll(producer, 0);
+  }
+  rd_kafka_flush(producer, 60 * 1000);
+  const double elapsed = std::chrono::duration<double>(bench_clock::now() - start).count();
+  rd_kafka_destroy(producer);
+
+  std::sort(stats.latencies_us.begin(), stats.latencies_us.end());
+  const double p99 = stats.latencies_us.empty() ? 0. : stats.latencies_us[stats.latencies_us.size() * 99 / 100];
+  std::cout << codec << ": " << static_cast<long>(stats.latencies_us.size() / elapsed) << " msgs/s, p99 delivery latency "
+            << p99 / 1000. << " ms, " << stats.failed << " failed" << std::endl;
+}
+
 int main(int argc, char const *argv[]) {
   rd_kafka_conf_t *conf = rd_kafka_conf_new();
   std::cout << std::endl
             << "----------------->Tests are done.<---------------------" << std::endl
 	    << "Using version " << rd_kafka_version_str() << std::endl
             << "///////////////////////////////////////////////////////" << std::endl;
+  rd_kafka_conf_destroy(conf);
+
+  // opt-in benchmark: test_package <message count>
+  if (argc > 1) {
+    const int message_count = std::atoi(argv[1]);
+    const char *codecs[] = {"none", "gzip", "snappy", "lz4", "zstd"};
+    for (const char *codec : codecs) {
+      produce_to_mock_cluster(codec, message_count);
+    }
+  }
   return 0;
 }
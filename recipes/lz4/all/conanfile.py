@@ -12,8 +12,20 @@ class LZ4Conan(ConanFile):
     exports_sources = "CMakeLists.txt", "patches/**"
     generators = "cmake"
     settings = "os", "compiler", "build_type", "arch"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "fast_dec_loop": ["auto", True, False],
+        "memory_access": ["auto", "memcpy", "packed", "direct"],
+        "hc_heapmode": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "fast_dec_loop": "auto",
+        "memory_access": "auto",
+        "hc_heapmode": True,
+    }
 
     _cmake = None
 
@@ -44,6 +56,18 @@ class LZ4Conan(ConanFile):
             subfolder = os.path.join("build", "cmake")
         return os.path.join(self._source_subfolder, subfolder).replace("\\", "/")
 
+    @property
+    def _compile_definitions(self):
+        definitions = []
+        if self.options.fast_dec_loop != "auto":
+            definitions.append("LZ4_FAST_DEC_LOOP={}".format(1 if self.options.fast_dec_loop else 0))
+        if self.options.memory_access != "auto":
+            memory_access = {"memcpy": 0, "packed": 1, "direct": 2}[str(self.options.memory_access)]
+            definitions.append("LZ4_FORCE_MEMORY_ACCESS={}".format(memory_access))
+            definitions.append("XXH_FORCE_MEMORY_ACCESS={}".format(memory_access))
+        definitions.append("LZ4HC_HEAPMODE={}".format(1 if self.options.hc_heapmode else 0))
+        return definitions
+
     def _configure_cmake(self):
         if self._cmake:
             return self._cmake
@@ -53,6 +77,7 @@ class LZ4Conan(ConanFile):
         self._cmake.definitions["LZ4_BUILD_LEGACY_LZ4C"] = False
         self._cmake.definitions["LZ4_BUNDLED_MODE"] = False
         self._cmake.definitions["LZ4_POSITION_INDEPENDENT_LIB"] = self.options.get_safe("fPIC", True)
+        self._cmake.definitions["CONAN_LZ4_COMPILE_DEFINITIONS"] = ";".join(self._compile_definitions)
         self._cmake.configure()
         return self._cmake
 
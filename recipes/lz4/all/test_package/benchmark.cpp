@@ -0,0 +1,75 @@
+// Compression/decompression throughput of the packaged lz4 on a deterministic corpus
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <vector>
+
+#include "lz4.h"
+#include "lz4hc.h"
+
+static std::vector<char> make_corpus(size_t size)
+{
+    static const char* const words[] = {"conan ", "package ", "manager ", "lz4 ", "compression ", "fast ", "0123 ", "\n"};
+    std::vector<char> corpus;
+    corpus.reserve(size);
+    unsigned long state = 12345;
+    while (corpus.size() < size) {
+        state = state * 1103515245UL + 12345UL;
+        const char* word = words[(state >> 16) % (sizeof(words) / sizeof(words[0]))];
+        for (; *word && corpus.size() < size; ++word) {
+            corpus.push_back(*word);
+        }
+    }
+    return corpus;
+}
+
+template <typename F>
+static double seconds(F&& f)
+{
+    const auto start = std::chrono::steady_clock::now();
+    f();
+    return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+}
+
+static double mb_per_s(size_t bytes, double duration)
+{
+    return duration > 0. ? bytes / (1024. * 1024.) / duration : 0.;
+}
+
+int main()
+{
+    const std::vector<char> corpus = make_corpus(8 * 1024 * 1024);
+    const int src_size = static_cast<int>(corpus.size());
+    std::vector<char> compressed(LZ4_compressBound(src_size));
+    std::vector<char> decompressed(corpus.size());
+
+    const int levels[] = {0, LZ4HC_CLEVEL_DEFAULT, LZ4HC_CLEVEL_MAX};
+    for (int level : levels) {
+        int compressed_size = 0;
+        const double compress_time = seconds([&] {
+            if (level == 0) {
+                compressed_size = LZ4_compress_default(corpus.data(), compressed.data(), src_size, static_cast<int>(compressed.size()));
+            } else {
+                compressed_size = LZ4_compress_HC(corpus.data(), compressed.data(), src_size, static_cast<int>(compressed.size()), level);
+            }
+        });
+        if (compressed_size <= 0) {
+            std::fprintf(stderr, "compression failed (level %d)\n", level);
+            return EXIT_FAILURE;
+        }
+        int decompressed_size = 0;
+        const double decompress_time = seconds([&] {
+            decompressed_size = LZ4_decompress_safe(compressed.data(), decompressed.data(), compressed_size, src_size);
+        });
+        if (decompressed_size != src_size || std::memcmp(corpus.data(), decompressed.data(), corpus.size()) != 0) {
+            std::fprintf(stderr, "round-trip failed (level %d)\n", level);
+            return EXIT_FAILURE;
+        }
+        std::printf("%s level %d: ratio %.2f, compress %.1f MB/s, decompress %.1f MB/s\n",
+                    level == 0 ? "LZ4" : "LZ4HC", level, static_cast<double>(src_size) / compressed_size,
+                    mb_per_s(corpus.size(), compress_time), mb_per_s(corpus.size(), decompress_time));
+    }
+    return EXIT_SUCCESS;
+}
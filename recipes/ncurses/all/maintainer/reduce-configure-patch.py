@@ -5,27 +5,290 @@
 # This script is very crude in that it only checks whether a number is changed.
 
 import argparse
-import patch_ng
+import difflib
+import io
+import re
 import string
+import sys
 
 
-def hunk_contains_only_line_diff(hunk: patch_ng.Hunk):
+DIGITS_REMOVE = bytes.maketrans(string.digits.encode(), ("X" * len(string.digits)).encode())
+
+HUNK_HEADER_REGEX = re.compile(rb"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+CONTEXT_PREFIXES = (b" ", b"\n", b"\r")
+
+
+def hunk_contains_only_line_diff(hunk):
     adds = []
     subs = []
-    digits_remove = bytes.maketrans(string.digits.encode(), ("X" * len(string.digits)).encode())
     for line in hunk.text:
         if line[0] == ord("+"):
-            adds.append(line[1:].translate(digits_remove))
+            adds.append(line[1:].translate(DIGITS_REMOVE))
         elif line[0] == ord("-"):
-            subs.append(line[1:].translate(digits_remove))
+            subs.append(line[1:].translate(DIGITS_REMOVE))
     return adds == subs
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("input", help="input file")
-    parser.add_argument("-o", dest="output", help="output file")
-    ns = parser.parse_args()
+def block_contains_only_line_diff(subs, adds):
+    """
+    Batched variant of hunk_contains_only_line_diff: subs and adds are the removed and added lines (including the -/+ prefix)
+    """
+    if len(subs) != len(adds):
+        return False
+    return b"".join(line[1:] for line in subs).translate(DIGITS_REMOVE) == b"".join(line[1:] for line in adds).translate(DIGITS_REMOVE)
+
+
+class Stats(object):
+    def __init__(self):
+        self.hunks = 0
+        self.hunks_dropped = 0
+        self.hunks_reduced = 0
+        self.files_dropped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def report(self, stream):
+        saved = self.bytes_in - self.bytes_out
+        stream.write("hunks: {}, dropped: {}, reduced: {}, files dropped: {}\n".format(self.hunks, self.hunks_dropped, self.hunks_reduced, self.files_dropped))
+        stream.write("bytes in: {}, bytes out: {}, saved: {} ({:.1f}%)\n".format(
+            self.bytes_in, self.bytes_out, saved, 100. * saved / self.bytes_in if self.bytes_in else 0.))
+
+
+def iter_hunks(istream):
+    """
+    Read a unified diff one hunk at a time.
+    Yields (header_line, hunk_lines) for every hunk and (line, None) for every line outside a hunk.
+    """
+    lines = iter(istream)
+    pending = None
+    while True:
+        line = pending if pending is not None else next(lines, None)
+        pending = None
+        if line is None:
+            return
+        match = HUNK_HEADER_REGEX.match(line)
+        if not match:
+            yield line, None
+            continue
+        src_todo = int(match.group(2)) if match.group(2) is not None else 1
+        tgt_todo = int(match.group(4)) if match.group(4) is not None else 1
+        hunk_lines = []
+        for hunk_line in lines:
+            # A "\ No newline at end of file" marker can follow the last line of a hunk
+            if src_todo <= 0 and tgt_todo <= 0 and hunk_line[:1] != b"\\":
+                pending = hunk_line
+                break
+            hunk_lines.append(hunk_line)
+            prefix = hunk_line[:1]
+            if prefix in CONTEXT_PREFIXES:
+                src_todo -= 1
+                tgt_todo -= 1
+            elif prefix == b"-":
+                src_todo -= 1
+            elif prefix == b"+":
+                tgt_todo -= 1
+        yield line, hunk_lines
+
+
+def reduce_hunk(hunk_lines):
+    """
+    Drop all sub-blocks of a hunk where only numbers changed: the removed lines become context, the added lines are dropped.
+    Return the reduced hunk lines, or None when the hunk only contains line number changes.
+    The leading and trailing context of the result can become uneven: pass it through trim_context.
+    """
+    result = []
+    subs = []
+    adds = []
+    changes_kept = False
+
+    def flush():
+        nonlocal changes_kept
+        if not subs and not adds:
+            return
+        if block_contains_only_line_diff(subs, adds):
+            result.extend(line if line[:1] == b"\\" else b" " + line[1:] for line in subs)
+        else:
+            result.extend(subs)
+            result.extend(adds)
+            changes_kept = True
+        subs.clear()
+        adds.clear()
+
+    for line in hunk_lines:
+        prefix = line[:1]
+        if prefix == b"-":
+            if adds:
+                flush()
+            subs.append(line)
+        elif prefix == b"+":
+            adds.append(line)
+        elif prefix == b"\\":
+            # "\ No newline at end of file" belongs to the previous line
+            (adds or subs or result).append(line)
+        else:
+            flush()
+            result.append(line)
+    flush()
+    if not changes_kept:
+        return None
+    return result
+
+
+def trim_context(header_line, hunk_lines):
+    """
+    Trim the leading and trailing context of a hunk to the same length and return the updated (header_line, hunk_lines).
+    GNU patch takes a hunk with uneven context to be anchored to the start or the end of the file, and rejects it elsewhere.
+    """
+    leading = 0
+    while leading < len(hunk_lines) and hunk_lines[leading][:1] in CONTEXT_PREFIXES:
+        leading += 1
+    end = len(hunk_lines)
+    # A "\ No newline at end of file" marker belongs to the last line
+    while end > leading and hunk_lines[end - 1][:1] == b"\\":
+        end -= 1
+    trailing = 0
+    while end - trailing > leading and hunk_lines[end - trailing - 1][:1] in CONTEXT_PREFIXES:
+        trailing += 1
+    context = min(leading, trailing)
+    drop_leading = leading - context
+    drop_trailing = trailing - context
+    if not drop_leading and not drop_trailing:
+        return header_line, hunk_lines
+
+    match = HUNK_HEADER_REGEX.match(header_line)
+    src_start, tgt_start = int(match.group(1)), int(match.group(3))
+    src_len = int(match.group(2)) if match.group(2) is not None else 1
+    tgt_len = int(match.group(4)) if match.group(4) is not None else 1
+    # An empty range refers to the line before it
+    src_start += drop_leading + (1 if src_len == 0 else 0)
+    tgt_start += drop_leading + (1 if tgt_len == 0 else 0)
+    src_len -= drop_leading + drop_trailing
+    tgt_len -= drop_leading + drop_trailing
+    src_start -= 1 if src_len == 0 else 0
+    tgt_start -= 1 if tgt_len == 0 else 0
+    header_line = b"@@ -%d,%d +%d,%d @@" % (src_start, src_len, tgt_start, tgt_len) + header_line[match.end():]
+
+    if drop_trailing:
+        hunk_lines = hunk_lines[:end - drop_trailing]
+    return header_line, hunk_lines[drop_leading:]
+
+
+def stream_reduce(istream, ostream, stats):
+    # Lines outside hunks (file headers) are held back until a hunk of their file is kept,
+    # so files whose hunks are all dropped vanish from the output.
+    header = []
+    header_has_hunks = False
+
+    def write(lines):
+        for out_line in lines:
+            ostream.write(out_line)
+            stats.bytes_out += len(out_line)
+
+    for line, hunk_lines in iter_hunks(istream):
+        stats.bytes_in += len(line) + sum(len(hunk_line) for hunk_line in hunk_lines or ())
+        if hunk_lines is None:
+            if header_has_hunks:
+                stats.files_dropped += 1
+                header = []
+                header_has_hunks = False
+            header.append(line)
+            continue
+        stats.hunks += 1
+        reduced = reduce_hunk(hunk_lines)
+        if reduced is None:
+            stats.hunks_dropped += 1
+            header_has_hunks = bool(header)
+            continue
+        if reduced != hunk_lines:
+            stats.hunks_reduced += 1
+            line, reduced = trim_context(line, reduced)
+        write(header)
+        header = []
+        header_has_hunks = False
+        write([line])
+        write(reduced)
+    if header_has_hunks:
+        stats.files_dropped += 1
+    else:
+        write(header)
+
+
+def hunk_sides(hunk_lines):
+    """
+    Return the (source, target) lines of a hunk, without the -/+/space prefixes.
+    """
+    source = [line[1:] for line in hunk_lines if line[:1] not in (b"+", b"\\")]
+    target = [line[1:] for line in hunk_lines if line[:1] not in (b"-", b"\\")]
+    return source, target
+
+
+def compare_hunk_text(expected, actual):
+    """
+    Check that a hunk emitted by --stream (actual) is equivalent to the patch_ng hunk (expected):
+    its source must be an exact slice of the expected source, and its target must be the matching slice of the expected
+    target up to the line numbers that were not applied.
+    """
+    offset = actual.startsrc - expected.startsrc
+    if offset < 0 or actual.starttgt - expected.starttgt != offset:
+        return False
+    expected_source, expected_target = hunk_sides(expected.text)
+    actual_source, actual_target = hunk_sides(actual.text)
+    if actual_source != expected_source[offset:offset + len(actual_source)]:
+        return False
+    expected_target = expected_target[offset:offset + len(actual_target)]
+    return [line.translate(DIGITS_REMOVE) for line in actual_target] == [line.translate(DIGITS_REMOVE) for line in expected_target]
+
+
+def compare_with_patchset(input_path):
+    """
+    Regression check: the streaming classifier must drop the same whole hunks as the patch_ng based implementation,
+    and the patch emitted by --stream must parse back to hunks equivalent to the ones patch_ng keeps.
+    """
+    import patch_ng
+    patchset = patch_ng.fromfile(input_path)
+    if not patchset:
+        return 1
+    expected = [hunk_contains_only_line_diff(hunk) for item in patchset.items for hunk in item.hunks]
+    with open(input_path, "rb") as istream:
+        actual = [reduce_hunk([line for line in hunk_lines if line[:1] != b"\\"]) is None
+                  for _, hunk_lines in iter_hunks(istream) if hunk_lines is not None]
+    if len(expected) != len(actual):
+        sys.stderr.write("Number of hunks differ: patch_ng={}, stream={}\n".format(len(expected), len(actual)))
+        return 1
+    mismatches = [i for i, (e, a) in enumerate(zip(expected, actual)) if e != a]
+    for i in mismatches:
+        sys.stderr.write("Hunk #{} is classified differently: patch_ng={}, stream={}\n".format(i, expected[i], actual[i]))
+    sys.stderr.write("{} hunks compared, {} mismatches\n".format(len(expected), len(mismatches)))
+    if mismatches:
+        return 1
+
+    ostream = io.BytesIO()
+    with open(input_path, "rb") as istream:
+        stream_reduce(istream, ostream, Stats())
+    streamed = patch_ng.fromstring(ostream.getvalue())
+    if not streamed:
+        sys.stderr.write("The --stream output is not a valid patch\n")
+        return 1
+    expected_hunks = [hunk for item in patchset.items for hunk in item.hunks if not hunk_contains_only_line_diff(hunk)]
+    actual_hunks = [hunk for item in streamed.items for hunk in item.hunks]
+    if len(expected_hunks) != len(actual_hunks):
+        sys.stderr.write("Number of emitted hunks differ: patch_ng={}, stream={}\n".format(len(expected_hunks), len(actual_hunks)))
+        return 1
+    text_mismatches = 0
+    for i, (expected_hunk, actual_hunk) in enumerate(zip(expected_hunks, actual_hunks)):
+        if compare_hunk_text(expected_hunk, actual_hunk):
+            continue
+        text_mismatches += 1
+        sys.stderr.write("Emitted hunk #{} differs:\n".format(i))
+        sys.stderr.buffer.writelines(difflib.diff_bytes(difflib.unified_diff, expected_hunk.text, actual_hunk.text, b"patch_ng", b"stream"))
+        sys.stderr.flush()
+    sys.stderr.write("{} emitted hunks compared, {} mismatches\n".format(len(expected_hunks), text_mismatches))
+    return 1 if text_mismatches else 0
+
+
+def main_patchset(ns):
+    import patch_ng
     patchset: patch_ng.PatchSet = patch_ng.fromfile(ns.input)
     if not patchset:
         return 1
@@ -44,6 +307,34 @@ def main():
     return 0
 
 
+def main_stream(ns):
+    stats = Stats()
+    with open(ns.input, "rb") as istream:
+        if ns.output:
+            with open(ns.output, "wb") as ostream:
+                stream_reduce(istream, ostream, stats)
+        else:
+            stream_reduce(istream, sys.stdout.buffer, stats)
+    if ns.stats:
+        stats.report(sys.stderr)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="input file")
+    parser.add_argument("-o", dest="output", help="output file")
+    parser.add_argument("--stream", action="store_true",
+                        help="read and write the diff hunk by hunk, and also drop the line-number-only parts of the other hunks")
+    parser.add_argument("--stats", action="store_true", help="print the number of dropped hunks and saved bytes (with --stream)")
+    parser.add_argument("--compare", action="store_true", help="check whether --stream drops the same hunks as the default implementation and emits equivalent hunks")
+    ns = parser.parse_args()
+    if ns.compare:
+        return compare_with_patchset(ns.input)
+    if ns.stream:
+        return main_stream(ns)
+    return main_patchset(ns)
+
+
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -19,12 +19,20 @@ class NngConan(ConanFile):
         "fPIC": [True, False],
         "nngcat": [True, False],
         "http": [True, False],
+        "tls": [True, False],
+        "num_taskq_threads": "ANY",
+        "max_taskq_threads": "ANY",
+        "resolv_concurrency": "ANY",
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "nngcat": False,
         "http": True,
+        "tls": False,
+        "num_taskq_threads": 0,
+        "max_taskq_threads": 16,
+        "resolv_concurrency": 4,
     }
 
     _source_subfolder = "source_subfolder"
@@ -48,15 +56,30 @@ class NngConan(ConanFile):
                 tools.Version(self.settings.compiler.version) < 14:
             raise ConanInvalidConfiguration("MSVC < 14 is not supported")
 
+        for option in ["num_taskq_threads", "max_taskq_threads", "resolv_concurrency"]:
+            if not str(self.options.get_safe(option)).isdigit():
+                raise ConanInvalidConfiguration("{} must be a non-negative integer".format(option))
+        if int(self.options.resolv_concurrency) < 1:
+            raise ConanInvalidConfiguration("resolv_concurrency must be at least 1")
+
+    def requirements(self):
+        if self.options.tls:
+            self.requires("mbedtls/2.16.3-apache")
+
     def _configure_cmake(self):
         if self._cmake:
             return self._cmake
 
         self._cmake = CMake(self)
         self._cmake.definitions["NNG_TESTS"] = False
-        self._cmake.definitions["NNG_ENABLE_TLS"] = False
+        self._cmake.definitions["NNG_ENABLE_TLS"] = self.options.tls
+        if self.options.tls:
+            self._cmake.definitions["MBEDTLS_ROOT_DIR"] = self.deps_cpp_info["mbedtls"].rootpath.replace("\\", "/")
         self._cmake.definitions["NNG_ENABLE_NNGCAT"] = self.options.nngcat
         self._cmake.definitions["NNG_ENABLE_HTTP"] = self.options.http
+        self._cmake.definitions["NNG_NUM_TASKQ_THREADS"] = self.options.num_taskq_threads
+        self._cmake.definitions["NNG_MAX_TASKQ_THREADS"] = self.options.max_taskq_threads
+        self._cmake.definitions["NNG_RESOLV_CONCURRENCY"] = self.options.resolv_concurrency
         self._cmake.configure()
 
         return self._cmake
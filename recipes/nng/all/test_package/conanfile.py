@@ -8,6 +8,7 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["NNG_ENABLE_TLS"] = self.options["nng"].tls
         cmake.configure()
         cmake.build()
 
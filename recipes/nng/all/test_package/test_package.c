@@ -1,9 +1,95 @@
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
 
 #include <nng/nng.h>
+#include <nng/protocol/reqrep0/rep.h>
+#include <nng/protocol/reqrep0/req.h>
 #include <nng/supplemental/util/platform.h>
+#ifdef NNG_ENABLE_TLS
+#include <nng/supplemental/tls/tls.h>
+#endif
+
+#define ROUNDTRIPS 10000
+#define ADDRESS "inproc://test_package"
+
+static void echo(void *arg) {
+    nng_socket *rep = arg;
+    nng_msg *msg;
+    int i;
+
+    for (i = 0; i < ROUNDTRIPS; ++i) {
+        if (nng_recvmsg(*rep, &msg, 0) != 0) {
+            return;
+        }
+        if (nng_sendmsg(*rep, msg, 0) != 0) {
+            nng_msg_free(msg);
+            return;
+        }
+    }
+}
+
+static int fatal(const char *what, int rv) {
+    fprintf(stderr, "%s: %s\n", what, nng_strerror(rv));
+    return EXIT_FAILURE;
+}
 
 int main(int argc, char *argv[]) {
+    nng_socket rep;
+    nng_socket req;
+    nng_thread *thread;
+    nng_time start;
+    nng_duration elapsed;
+    char payload[64];
+    int rv;
+    int i;
+
     nng_msleep(0);
+
+#ifdef NNG_ENABLE_TLS
+    {
+        nng_tls_config *config;
+        if ((rv = nng_tls_config_alloc(&config, NNG_TLS_MODE_CLIENT)) != 0) {
+            return fatal("nng_tls_config_alloc", rv);
+        }
+        nng_tls_config_free(config);
+        printf("TLS configuration: ok\n");
+    }
+#endif
+
+    if ((rv = nng_rep0_open(&rep)) != 0 || (rv = nng_req0_open(&req)) != 0) {
+        return fatal("nng_req0_open", rv);
+    }
+    if ((rv = nng_listen(rep, ADDRESS, NULL, 0)) != 0) {
+        return fatal("nng_listen", rv);
+    }
+    if ((rv = nng_dial(req, ADDRESS, NULL, 0)) != 0) {
+        return fatal("nng_dial", rv);
+    }
+    if ((rv = nng_thread_create(&thread, echo, &rep)) != 0) {
+        return fatal("nng_thread_create", rv);
+    }
+
+    memset(payload, 'x', sizeof(payload));
+    start = nng_clock();
+    for (i = 0; i < ROUNDTRIPS; ++i) {
+        char *reply;
+        size_t size;
+        if ((rv = nng_send(req, payload, sizeof(payload), 0)) != 0) {
+            return fatal("nng_send", rv);
+        }
+        if ((rv = nng_recv(req, &reply, &size, NNG_FLAG_ALLOC)) != 0) {
+            return fatal("nng_recv", rv);
+        }
+        nng_free(reply, size);
+    }
+    elapsed = (nng_duration)(nng_clock() - start);
+    nng_thread_destroy(thread);
+
+    printf("%d req/rep round-trips over %s: %.2f us per round-trip\n",
+           ROUNDTRIPS, ADDRESS, elapsed * 1000.0 / ROUNDTRIPS);
+
+    nng_close(req);
+    nng_close(rep);
     return 0;
 }
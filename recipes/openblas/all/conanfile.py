@@ -1,4 +1,5 @@
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 
 
@@ -20,13 +21,25 @@ class OpenblasConan(ConanFile):
         "build_lapack": [True, False],
         "use_thread": [True, False],
         "dynamic_arch": [True, False],
+        "use_openmp": [True, False],
+        "num_threads": "ANY",
+        "target": "ANY",
+        "use_tls": [True, False],
+        "buffersize": "ANY",
+        "no_affinity": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "build_lapack": False,
         "use_thread": True,
-        "dynamic_arch": False
+        "dynamic_arch": False,
+        "use_openmp": False,
+        "num_threads": "",
+        "target": "",
+        "use_tls": False,
+        "buffersize": "",
+        "no_affinity": True
     }
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake"
@@ -38,6 +51,28 @@ class OpenblasConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if tools.Version(self.version) < "0.3.10":
+            del self.options.buffersize
+        if tools.Version(self.version) < "0.3.11":
+            del self.options.use_tls
+
+    def configure(self):
+        if self.options.use_openmp:
+            if not self.options.use_thread:
+                raise ConanInvalidConfiguration("use_openmp requires use_thread")
+            if self.settings.compiler not in ("gcc", "clang"):
+                raise ConanInvalidConfiguration("OpenBLAS can't be built with OpenMP by {}".format(self.settings.compiler))
+        if self.options.num_threads and \
+           (not str(self.options.num_threads).isdigit() or int(str(self.options.num_threads)) < 1):
+            raise ConanInvalidConfiguration("num_threads must be a positive integer")
+        if self.options.target:
+            if self.options.dynamic_arch:
+                raise ConanInvalidConfiguration("target pins a single core type and can't be combined with dynamic_arch")
+            if not str(self.options.target).isalnum():
+                raise ConanInvalidConfiguration("target must be an OpenBLAS core name (e.g. HASWELL, SKYLAKEX, ARMV8)")
+        if self.options.get_safe("buffersize") and \
+           (not str(self.options.buffersize).isdigit() or not 20 <= int(str(self.options.buffersize)) <= 32):
+            raise ConanInvalidConfiguration("buffersize is the base 2 log of the buffer size, between 20 and 32")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -54,6 +89,16 @@ class OpenblasConan(ConanFile):
         self._cmake.definitions["BUILD_WITHOUT_LAPACK"] = not self.options.build_lapack
         self._cmake.definitions["DYNAMIC_ARCH"] = self.options.dynamic_arch
         self._cmake.definitions["USE_THREAD"] = self.options.use_thread
+        self._cmake.definitions["USE_OPENMP"] = self.options.use_openmp
+        self._cmake.definitions["NO_AFFINITY"] = self.options.no_affinity
+        if self.options.get_safe("use_tls") is not None:
+            self._cmake.definitions["USE_TLS"] = self.options.use_tls
+        if self.options.num_threads:
+            self._cmake.definitions["NUM_THREADS"] = self.options.num_threads
+        if self.options.target:
+            self._cmake.definitions["TARGET"] = str(self.options.target).upper()
+        if self.options.get_safe("buffersize"):
+            self._cmake.definitions["BUFFERSIZE"] = self.options.buffersize
 
         # Required for safe concurrent calls to OpenBLAS routines
         self._cmake.definitions["USE_LOCKING"] = not self.options.use_thread
@@ -82,11 +127,15 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.names["cmake_find_package"] = "OpenBLAS"
         self.cpp_info.names["cmake_find_package_multi"] = "OpenBLAS"
         self.cpp_info.names["pkg_config"] = "openblas"
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"
+        if self.options.use_openmp:
+            cmake_component_name = "openmp"
+        elif self.options.use_thread:
+            cmake_component_name = "pthread"
+        else:
+            cmake_component_name = "serial"
         self.cpp_info.components["openblas_component"].names["cmake_find_package"] = cmake_component_name
         self.cpp_info.components["openblas_component"].names["cmake_find_package_multi"] = cmake_component_name
         self.cpp_info.components["openblas_component"].names["pkg_config"] = "openblas"
@@ -96,6 +145,9 @@ class OpenblasConan(ConanFile):
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.use_openmp:
+            self.cpp_info.components["openblas_component"].sharedlinkflags.append("-fopenmp")
+            self.cpp_info.components["openblas_component"].exelinkflags.append("-fopenmp")
 
         self.output.info("Setting OpenBLAS_HOME environment variable: {}".format(self.package_folder))
         self.env_info.OpenBLAS_HOME = self.package_folder
@@ -1,6 +1,24 @@
 #include <openblas/cblas.h>
 #include <stdio.h>
 
+#include <chrono>
+#include <vector>
+
+static void dgemm_benchmark(int n, int threads)
+{
+  openblas_set_num_threads(threads);
+  std::vector<double> A(n * n, 1.0), B(n * n, 0.5), C(n * n, 0.0);
+  const int repeat = n <= 256 ? 20 : 2;
+
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < repeat; ++i)
+    cblas_dgemm(CblasColMajor, CblasNoTrans, CblasNoTrans, n, n, n, 1.0, A.data(), n, B.data(), n, 0.0, C.data(), n);
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+  printf("dgemm n=%4d threads=%d: %8.2f GFLOP/s\n", n, openblas_get_num_threads(),
+         2.0 * n * n * n * repeat / elapsed.count() * 1e-9);
+}
+
 int main()
 {
   int i=0;
@@ -12,4 +30,11 @@ int main()
   for(i=0; i<9; i++)
     printf("%lf ", C[i]);
   printf("\n");
+
+  printf("%s\n", openblas_get_config());
+  const int threads[] = {1, 2, 4};
+  const int sizes[] = {64, 256, 1024};
+  for (int t : threads)
+    for (int n : sizes)
+      dgemm_benchmark(n, t);
 }
@@ -26,6 +26,9 @@ class RocksDB(ConanFile):
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
+        "with_hw_crc32c": [True, False],
+        "jemalloc_background_thread": [True, False],
+        "build_tools": [True, False],
         "use_rtti": [True, False]
     }
     default_options = {
@@ -40,6 +43,9 @@ class RocksDB(ConanFile):
         "with_tbb": False,
         "with_jemalloc": False,
         "enable_sse": False,
+        "with_hw_crc32c": False,
+        "jemalloc_background_thread": False,
+        "build_tools": False,
         "use_rtti": False
     }
     exports_sources = ["CMakeLists.txt", "patches/**"]
@@ -61,6 +67,8 @@ class RocksDB(ConanFile):
 
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+            # armv8 CRC32c instructions are detected by rocksdb itself
+            del self.options.with_hw_crc32c
 
     def configure(self):
         if self.settings.compiler.cppstd:
@@ -76,6 +84,18 @@ class RocksDB(ConanFile):
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
+        # jemalloc background threads are only supported on Linux
+        if not self.options.with_jemalloc or self.settings.os != "Linux":
+            del self.options.jemalloc_background_thread
+        elif self.options.jemalloc_background_thread:
+            # compiled into jemalloc, so that it applies outside of conan run environments too
+            self.options["jemalloc"].malloc_conf = "background_thread:true"
+        if self.options.build_tools:
+            if self.options.lite:
+                raise ConanInvalidConfiguration("rocksdb tools can't be built with lite=True")
+            if not self.options.with_gflags:
+                raise ConanInvalidConfiguration("rocksdb tools (db_bench, ldb) require with_gflags=True")
+
     def requirements(self):
         if self.options.with_gflags:
             self.requires("gflags/2.2.2")
@@ -106,9 +126,9 @@ class RocksDB(ConanFile):
 
         self._cmake.definitions["FAIL_ON_WARNINGS"] = False
         self._cmake.definitions["WITH_TESTS"] = False
-        self._cmake.definitions["WITH_TOOLS"] = False
-        self._cmake.definitions["WITH_CORE_TOOLS"] = False
-        self._cmake.definitions["WITH_BENCHMARK_TOOLS"] = False
+        self._cmake.definitions["WITH_TOOLS"] = self.options.build_tools
+        self._cmake.definitions["WITH_CORE_TOOLS"] = self.options.build_tools
+        self._cmake.definitions["WITH_BENCHMARK_TOOLS"] = self.options.build_tools
         self._cmake.definitions["WITH_FOLLY_DISTRIBUTED_MUTEX"] = False
         self._cmake.definitions["WITH_MD_LIBRARY"] = self.settings.compiler == "Visual Studio" and "MD" in self.settings.compiler.runtime
         self._cmake.definitions["ROCKSDB_INSTALL_ON_WINDOWS"] = self.settings.os == "Windows"
@@ -134,6 +154,9 @@ class RocksDB(ConanFile):
         elif self.options.enable_sse == "avx2":
           self._cmake.definitions["PORTABLE"] = False
           self._cmake.definitions["FORCE_SSE42"] = False
+        if self.options.get_safe("with_hw_crc32c"):
+          # SSE4.2 crc32 and PCLMUL carry-less multiplication for CRC32c checksums
+          self._cmake.definitions["FORCE_SSE42"] = True
 
         # not available yet in CCI
 
@@ -164,11 +187,20 @@ class RocksDB(ConanFile):
                 else:
                     shutil.rmtree(path)
 
+    @property
+    def _tools(self):
+        return ["db_bench", "ldb", "sst_dump"]
+
     def package(self):
         self.copy("COPYING", dst="licenses", src=self._source_subfolder)
         self.copy("LICENSE*", dst="licenses", src=self._source_subfolder)
         cmake = self._configure_cmake()
         cmake.install()
+        if self.options.build_tools:
+            # rocksdb does not install its tools
+            for tool in self._tools:
+                for pattern in [tool, "{}.exe".format(tool)]:
+                    self.copy(pattern, dst="bin", src=self._build_subfolder, keep_path=False)
         if self.options.shared:
             self._remove_static_libraries()
             self._remove_cpp_headers() # Force stable ABI for shared libraries
@@ -203,3 +235,7 @@ class RocksDB(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("tbb::tbb")
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        if self.options.build_tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
@@ -20,3 +20,8 @@ class TestPackageConan(ConanFile):
 
             bin_path = os.path.join("bin", "test_package_stable_abi")
             self.run(bin_path, run_environment=True)
+
+            if self.options["rocksdb"].build_tools:
+                db_path = os.path.join(self.build_folder, "db_bench_data")
+                self.run("db_bench --benchmarks=fillrandom,readrandom --num=100000 --value_size=100 "
+                         "--compression_type=none --db={}".format(db_path), run_environment=True)
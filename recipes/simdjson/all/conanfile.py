@@ -15,10 +15,20 @@ class SimdjsonConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
-               "threads": [True, False]}
+               "threads": [True, False],
+               "exceptions": [True, False],
+               "implementation_haswell": [True, False],
+               "implementation_westmere": [True, False],
+               "implementation_arm64": [True, False],
+               "implementation_fallback": [True, False]}
     default_options = {'shared': False,
                        'fPIC': True,
-                       'threads': True}
+                       'threads': True,
+                       'exceptions': True,
+                       'implementation_haswell': True,
+                       'implementation_westmere': True,
+                       'implementation_arm64': True,
+                       'implementation_fallback': True}
     _cmake = None
 
     @property
@@ -38,9 +48,18 @@ class SimdjsonConan(ConanFile):
             "apple-clang": "9.4",
         }
 
+    @property
+    def _implementations(self):
+        return ["haswell", "westmere", "arm64", "fallback"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch != "x86_64":
+            del self.options.implementation_haswell
+            del self.options.implementation_westmere
+        if self.settings.arch != "armv8":
+            del self.options.implementation_arm64
 
     def configure(self):
         if self.options.shared:
@@ -55,6 +74,9 @@ class SimdjsonConan(ConanFile):
         else:
             self.output.warn("{} requires C++17. Your compiler is unknown. Assuming it supports C++17.".format(self.name))
 
+        if not any(self.options.get_safe("implementation_" + implementation) for implementation in self._implementations):
+            raise ConanInvalidConfiguration("At least one simdjson implementation must be enabled")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         extracted_dir = self.name + "-" + self.version
@@ -68,9 +90,25 @@ class SimdjsonConan(ConanFile):
         self._cmake.definitions['SIMDJSON_ENABLE_THREADS'] = self.options.threads
         self._cmake.definitions['SIMDJSON_SANITIZE'] = False
         self._cmake.definitions['SIMDJSON_JUST_LIBRARY'] = True
+        self._cmake.definitions['SIMDJSON_EXCEPTIONS'] = self.options.exceptions
+        for implementation in self._implementations:
+            self._cmake.definitions['SIMDJSON_IMPLEMENTATION_{}'.format(implementation.upper())] = self.options.get_safe("implementation_" + implementation, False)
+        # simdjson's headers and sources also honor the macros: make sure the library is built with them
+        self._cmake.definitions['CONAN_SIMDJSON_DEFINITIONS'] = ";".join(self._configuration_defines)
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
+    @property
+    def _configuration_defines(self):
+        defines = []
+        if not self.options.exceptions:
+            defines.append("SIMDJSON_EXCEPTIONS=0")
+        for implementation in self._implementations:
+            if self.options.get_safe("implementation_" + implementation) is not None and \
+               not self.options.get_safe("implementation_" + implementation):
+                defines.append("SIMDJSON_IMPLEMENTATION_{}=0".format(implementation.upper()))
+        return defines
+
     def build(self):
         cmake = self._configure_cmake()
         cmake.build()
@@ -85,8 +123,9 @@ class SimdjsonConan(ConanFile):
         self.cpp_info.libs = ['simdjson']
         if self.settings.os == "Linux":
             self.cpp_info.system_libs = ["m"]
+        self.cpp_info.defines = self._configuration_defines
         if self.options.threads:
-            self.cpp_info.defines = ["SIMDJSON_THREADS_ENABLED=1"]
+            self.cpp_info.defines.append("SIMDJSON_THREADS_ENABLED=1")
             if self.settings.os == "Linux":
                 self.cpp_info.system_libs.append("pthread")
         if self.options.shared:
@@ -1,4 +1,5 @@
 from conans import ConanFile, CMake, tools
+from conans.tools import Version
 import os
 
 
@@ -8,6 +9,9 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        # The ondemand API appeared in simdjson 0.7.0, this test uses it with exceptions
+        cmake.definitions["SIMDJSON_TEST_ONDEMAND"] = Version(self.deps_cpp_info["simdjson"].version) >= "0.7.0" and \
+                                                      self.options["simdjson"].exceptions
         cmake.configure()
         cmake.build()
 
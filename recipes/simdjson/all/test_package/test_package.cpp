@@ -1,7 +1,30 @@
 #include "simdjson.h"
+#include <chrono>
+#include <cstdint>
 #include <iostream>
 #include <string>
 
+// Build a document of about 4 MB: {"items":[{"id":0,"name":"item 0","values":[...],"valid":true},...]}
+static std::string generate_document(size_t items) {
+  std::string json = "{\"items\":[";
+  for (size_t i = 0; i < items; ++i) {
+    if (i) json += ",";
+    json += "{\"id\":" + std::to_string(i) + ",\"name\":\"item " + std::to_string(i) + "\",\"values\":[";
+    for (size_t j = 0; j < 8; ++j) {
+      if (j) json += ",";
+      json += std::to_string(i * 0.25 + j);
+    }
+    json += "],\"valid\":true}";
+  }
+  json += "]}";
+  return json;
+}
+
+static void report(const char *api, size_t bytes, std::chrono::steady_clock::duration elapsed, uint64_t sum) {
+  double seconds = std::chrono::duration<double>(elapsed).count();
+  std::cout << api << ": " << bytes / seconds * 1e-9 << " GB/s (checksum " << sum << ")" << std::endl;
+}
+
 int main() {
   std::string mystring = "{ \"hello\": \"simdjson\" }";
   simdjson::dom::parser parser;
@@ -15,5 +38,46 @@ int main() {
     std::cerr << string_value << std::endl;
     return EXIT_FAILURE;
   }
+
+  std::cout << "active implementation: " << simdjson::active_implementation->name()
+            << " (" << simdjson::active_implementation->description() << ")" << std::endl;
+
+  simdjson::padded_string json(generate_document(30000));
+  const int repeat = 10;
+
+  auto start = std::chrono::steady_clock::now();
+  uint64_t dom_sum = 0;
+  for (int i = 0; i < repeat; ++i) {
+    simdjson::dom::array items;
+    error = parser.parse(json)["items"].get(items);
+    if (error) {
+      std::cerr << error << std::endl;
+      return EXIT_FAILURE;
+    }
+    for (simdjson::dom::element item : items) {
+      uint64_t id;
+      if (item["id"].get(id)) {
+        return EXIT_FAILURE;
+      }
+      dom_sum += id;
+    }
+  }
+  report("dom", json.size() * repeat, std::chrono::steady_clock::now() - start, dom_sum);
+
+#ifdef SIMDJSON_TEST_ONDEMAND
+  simdjson::ondemand::parser ondemand_parser;
+  start = std::chrono::steady_clock::now();
+  uint64_t ondemand_sum = 0;
+  for (int i = 0; i < repeat; ++i) {
+    simdjson::ondemand::document doc = ondemand_parser.iterate(json);
+    for (simdjson::ondemand::object item : doc["items"]) {
+      ondemand_sum += uint64_t(item["id"]);
+    }
+  }
+  report("ondemand", json.size() * repeat, std::chrono::steady_clock::now() - start, ondemand_sum);
+  if (ondemand_sum != dom_sum) {
+    return EXIT_FAILURE;
+  }
+#endif
   return EXIT_SUCCESS;
 }
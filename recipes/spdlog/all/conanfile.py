@@ -12,20 +12,34 @@ class SpdlogConan(ConanFile):
     topics = ("conan", "spdlog", "logging", "header-only")
     license = "MIT"
     exports_sources = ["CMakeLists.txt"]
-    generators = "cmake", "cmake_find_package"
+    generators = "cmake", "cmake_find_package", "cmake_find_package_multi"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
                "header_only": [True, False],
                "wchar_support": [True, False],
                "wchar_filenames": [True, False],
-               "no_exceptions": [True, False]}
+               "no_exceptions": [True, False],
+               "enable_pch": [True, False],
+               "no_thread_id": [True, False],
+               "no_atomic_levels": [True, False],
+               "clock_coarse": [True, False],
+               "disable_default_logger": [True, False],
+               "active_level": ["default", "trace", "debug", "info", "warn", "error", "critical", "off"],
+               "build_bench": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
                        "header_only": False,
                        "wchar_support": False,
                        "wchar_filenames": False,
-                       "no_exceptions": False}
+                       "no_exceptions": False,
+                       "enable_pch": False,
+                       "no_thread_id": False,
+                       "no_atomic_levels": False,
+                       "clock_coarse": False,
+                       "disable_default_logger": False,
+                       "active_level": "default",
+                       "build_bench": False}
 
     _cmake = None
 
@@ -36,11 +50,20 @@ class SpdlogConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if Version(self.version) < "1.6.0":
+            del self.options.enable_pch
+        if self.settings.os != "Linux":
+            # coarse clocks are only available on Linux
+            del self.options.clock_coarse
 
     def configure(self):
         if self.options.header_only:
             del self.options.shared
             del self.options.fPIC
+            if self.options.build_bench:
+                raise ConanInvalidConfiguration("spdlog benchmarks can't be built with header_only=True")
+            if Version(self.version) >= "1.6.0":
+                del self.options.enable_pch
         elif self.settings.os == "Windows" and self.options.shared and Version(self.version) < "1.6.0":
             raise ConanInvalidConfiguration("spdlog shared lib is not yet supported under windows")
         if self.settings.os != "Windows" and \
@@ -56,6 +79,8 @@ class SpdlogConan(ConanFile):
             self.requires("fmt/6.2.1")
         else:
             self.requires("fmt/6.0.0")
+        if self.options.build_bench:
+            self.requires("benchmark/1.5.2")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -70,7 +95,7 @@ class SpdlogConan(ConanFile):
         self._cmake.definitions["SPDLOG_BUILD_EXAMPLE_HO"] = False
         self._cmake.definitions["SPDLOG_BUILD_TESTS"] = False
         self._cmake.definitions["SPDLOG_BUILD_TESTS_HO"] = False
-        self._cmake.definitions["SPDLOG_BUILD_BENCH"] = False
+        self._cmake.definitions["SPDLOG_BUILD_BENCH"] = self.options.build_bench
         self._cmake.definitions["SPDLOG_FMT_EXTERNAL"] = True
         self._cmake.definitions["SPDLOG_FMT_EXTERNAL_HO"] = self.options["fmt"].header_only
         self._cmake.definitions["SPDLOG_BUILD_SHARED"] = not self.options.header_only and self.options.shared
@@ -78,11 +103,29 @@ class SpdlogConan(ConanFile):
         self._cmake.definitions["SPDLOG_WCHAR_FILENAMES"] = self.options.wchar_filenames
         self._cmake.definitions["SPDLOG_INSTALL"] = True
         self._cmake.definitions["SPDLOG_NO_EXCEPTIONS"] = self.options.no_exceptions
+        self._cmake.definitions["SPDLOG_ENABLE_PCH"] = self.options.get_safe("enable_pch", False)
+        # older spdlog versions have no CMake option for all of them: the wrapper adds them to the build
+        self._cmake.definitions["CONAN_SPDLOG_DEFINITIONS"] = ";".join(self._tuning_definitions)
         if self.settings.os in ("iOS", "tvOS", "watchOS"):
             self._cmake.definitions["SPDLOG_NO_TLS"] = True
         self._cmake.configure()
         return self._cmake
 
+    @property
+    def _tuning_definitions(self):
+        definitions = []
+        if self.options.no_thread_id:
+            definitions.append("SPDLOG_NO_THREAD_ID")
+        if self.options.no_atomic_levels:
+            definitions.append("SPDLOG_NO_ATOMIC_LEVELS")
+        if self.options.get_safe("clock_coarse"):
+            definitions.append("SPDLOG_CLOCK_COARSE")
+        if self.options.disable_default_logger:
+            definitions.append("SPDLOG_DISABLE_DEFAULT_LOGGER")
+        if self.options.active_level != "default":
+            definitions.append("SPDLOG_ACTIVE_LEVEL=SPDLOG_LEVEL_{}".format(str(self.options.active_level).upper()))
+        return definitions
+
     def _disable_werror(self):
         tools.replace_in_file(os.path.join(self._source_subfolder, "cmake", "utils.cmake"), "/WX", "")
 
@@ -105,6 +148,10 @@ class SpdlogConan(ConanFile):
             tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
             tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
             tools.rmdir(os.path.join(self.package_folder, "lib", "spdlog", "cmake"))
+            if self.options.build_bench:
+                for bench in ["bench", "async_bench", "latency", "formatter-bench"]:
+                    for pattern in [bench, "{}.exe".format(bench)]:
+                        self.copy(pattern, dst="bin", src=os.path.join(self._source_subfolder, "bench"), keep_path=False)
 
     def package_id(self):
         if self.options.header_only:
@@ -129,5 +176,10 @@ class SpdlogConan(ConanFile):
             self.cpp_info.components[component_name].defines.append("SPDLOG_WCHAR_FILENAMES")
         if self.options.no_exceptions:
             self.cpp_info.components[component_name].defines.append("SPDLOG_NO_EXCEPTIONS")
+        self.cpp_info.components[component_name].defines.extend(self._tuning_definitions)
         if self.settings.os == "Linux":
             self.cpp_info.components[component_name].system_libs = ["pthread"]
+        if self.options.build_bench:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
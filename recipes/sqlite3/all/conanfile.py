@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 
 required_conan_version = ">=1.28.0"
 
@@ -33,6 +34,17 @@ class ConanSqlite3(ConanFile):
                "enable_default_secure_delete": [True, False],
                "disable_gethostuuid": [True, False],
                "max_blob_size": "ANY",
+               "default_memstatus": [True, False],
+               "default_wal_synchronous": ["default", "off", "normal", "full", "extra"],
+               "default_page_size": "ANY",
+               "default_cache_size": "ANY",
+               "default_mmap_size": "ANY",
+               "max_mmap_size": "ANY",
+               "max_expr_depth": "ANY",
+               "like_doesnt_match_blobs": [True, False],
+               "omit_deprecated": [True, False],
+               "omit_shared_cache": [True, False],
+               "use_uri": [True, False],
                "build_executable": [True, False],
                }
     default_options = {"shared": False,
@@ -55,6 +67,17 @@ class ConanSqlite3(ConanFile):
                        "enable_default_secure_delete": False,
                        "disable_gethostuuid": False,
                        "max_blob_size": 1000000000,
+                       "default_memstatus": True,
+                       "default_wal_synchronous": "default",
+                       "default_page_size": "",
+                       "default_cache_size": "",
+                       "default_mmap_size": "",
+                       "max_mmap_size": "",
+                       "max_expr_depth": "",
+                       "like_doesnt_match_blobs": False,
+                       "omit_deprecated": False,
+                       "omit_shared_cache": False,
+                       "use_uri": False,
                        "build_executable": True,
                        }
 
@@ -73,6 +96,27 @@ class ConanSqlite3(ConanFile):
             del self.options.fPIC
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        page_size = self._integer_option("default_page_size")
+        if page_size is not None and (page_size < 512 or page_size > 65536 or page_size & (page_size - 1)):
+            raise ConanInvalidConfiguration("default_page_size must be a power of two between 512 and 65536")
+        self._integer_option("default_cache_size")
+        default_mmap_size = self._integer_option("default_mmap_size", minimum=0)
+        max_mmap_size = self._integer_option("max_mmap_size", minimum=0)
+        if default_mmap_size is not None and max_mmap_size is not None and default_mmap_size > max_mmap_size:
+            raise ConanInvalidConfiguration("default_mmap_size cannot be larger than max_mmap_size")
+        self._integer_option("max_expr_depth", minimum=0)
+
+    def _integer_option(self, name, minimum=None):
+        value = str(self.options.get_safe(name))
+        if value == "":
+            return None
+        try:
+            value = int(value)
+        except ValueError:
+            raise ConanInvalidConfiguration("{} must be an integer".format(name))
+        if minimum is not None and value < minimum:
+            raise ConanInvalidConfiguration("{} must be greater than or equal to {}".format(name, minimum))
+        return value
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -110,6 +154,18 @@ class ConanSqlite3(ConanFile):
         self._cmake.definitions["HAVE_USLEEP"] = True
         self._cmake.definitions["DISABLE_GETHOSTUUID"] = self.options.disable_gethostuuid
         self._cmake.definitions["MAX_BLOB_SIZE"] = self.options.max_blob_size
+        self._cmake.definitions["DEFAULT_MEMSTATUS"] = self.options.default_memstatus
+        wal_synchronous = {"off": 0, "normal": 1, "full": 2, "extra": 3}.get(str(self.options.default_wal_synchronous), "")
+        self._cmake.definitions["DEFAULT_WAL_SYNCHRONOUS"] = wal_synchronous
+        self._cmake.definitions["DEFAULT_PAGE_SIZE"] = self.options.default_page_size
+        self._cmake.definitions["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        self._cmake.definitions["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        self._cmake.definitions["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        self._cmake.definitions["MAX_EXPR_DEPTH"] = self.options.max_expr_depth
+        self._cmake.definitions["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
+        self._cmake.definitions["OMIT_DEPRECATED"] = self.options.omit_deprecated
+        self._cmake.definitions["OMIT_SHARED_CACHE"] = self.options.omit_shared_cache
+        self._cmake.definitions["USE_URI"] = self.options.use_uri
         self._cmake.configure()
         return self._cmake
 
@@ -132,6 +188,9 @@ class ConanSqlite3(ConanFile):
         self.cpp_info.components["sqlite"].names["cmake_find_package"] = "SQLite3"
         self.cpp_info.components["sqlite"].names["cmake_find_package_multi"] = "SQLite3"
         self.cpp_info.components["sqlite"].libs = tools.collect_libs(self)
+        if self.options.omit_deprecated:
+            # hides the declarations of the deprecated interfaces removed from the library
+            self.cpp_info.components["sqlite"].defines.append("SQLITE_OMIT_DEPRECATED")
         if self.settings.os in ["Linux", "FreeBSD"]:
             if self.options.threadsafe:
                 self.cpp_info.components["sqlite"].system_libs.append("pthread")
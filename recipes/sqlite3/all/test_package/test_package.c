@@ -1,7 +1,55 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
 #include <sqlite3.h>
 
+#define ROW_COUNT 100000
+
+static double rows_per_second(int rows, clock_t start, clock_t end) {
+    double seconds = (double)(end - start) / CLOCKS_PER_SEC;
+    return seconds > 0. ? rows / seconds : 0.;
+}
+
+static int run_workload(sqlite3* db_instance) {
+    sqlite3_stmt* statement = NULL;
+    sqlite3_int64 checksum = 0;
+    clock_t start;
+    int rows = 0;
+    int i;
+
+    if (sqlite3_exec(db_instance, "CREATE TABLE bench(ID INTEGER PRIMARY KEY, VALUE INT, NAME TEXT);", NULL, 0, NULL) != SQLITE_OK ||
+        sqlite3_prepare_v2(db_instance, "INSERT INTO bench(VALUE, NAME) VALUES(?, ?);", -1, &statement, NULL) != SQLITE_OK) {
+        return SQLITE_ERROR;
+    }
+    start = clock();
+    sqlite3_exec(db_instance, "BEGIN;", NULL, 0, NULL);
+    for (i = 0; i < ROW_COUNT; ++i) {
+        sqlite3_bind_int(statement, 1, i);
+        sqlite3_bind_text(statement, 2, "conan-center-index", -1, SQLITE_STATIC);
+        if (sqlite3_step(statement) != SQLITE_DONE) {
+            sqlite3_finalize(statement);
+            return SQLITE_ERROR;
+        }
+        sqlite3_reset(statement);
+    }
+    sqlite3_exec(db_instance, "COMMIT;", NULL, 0, NULL);
+    printf("insert: %d rows, %.0f rows/s\n", ROW_COUNT, rows_per_second(ROW_COUNT, start, clock()));
+    sqlite3_finalize(statement);
+
+    if (sqlite3_prepare_v2(db_instance, "SELECT VALUE FROM bench WHERE NAME LIKE 'conan%';", -1, &statement, NULL) != SQLITE_OK) {
+        return SQLITE_ERROR;
+    }
+    start = clock();
+    while (sqlite3_step(statement) == SQLITE_ROW) {
+        checksum += sqlite3_column_int(statement, 0);
+        ++rows;
+    }
+    printf("select: %d rows, %.0f rows/s\n", rows, rows_per_second(rows, start, clock()));
+    sqlite3_finalize(statement);
+
+    return rows == ROW_COUNT && checksum == (sqlite3_int64)ROW_COUNT * (ROW_COUNT - 1) / 2 ? SQLITE_OK : SQLITE_ERROR;
+}
+
 int main() {
     sqlite3* db_instance = NULL;
     char* errmsg = NULL;
@@ -10,6 +58,7 @@ int main() {
     printf("SQLite Version: %s\n", sqlite3_libversion());
 
     printf("Creating new data base ...\n");
+    remove("bincrafters.db");
     result = sqlite3_open("bincrafters.db", &db_instance);
     if (result != SQLITE_OK) {
         fprintf(stderr, "Can't open database: %s\n", sqlite3_errmsg(db_instance));
@@ -27,6 +76,16 @@ int main() {
     }
     printf("Done!\n");
 
+    printf("Running insert/select workload...\n");
+    sqlite3_exec(db_instance, "PRAGMA journal_mode=WAL;", NULL, 0, NULL);
+    result = run_workload(db_instance);
+    if(result != SQLITE_OK) {
+        fprintf(stderr, "Workload error: %s\n", sqlite3_errmsg(db_instance));
+        sqlite3_close(db_instance);
+        return EXIT_FAILURE;
+    }
+    printf("Done!\n");
+
     printf("Closing connection ...\n");
     sqlite3_close(db_instance);
     if(result != SQLITE_OK) {
@@ -38,4 +97,3 @@ int main() {
 
     return EXIT_SUCCESS;
 }
-
@@ -0,0 +1,120 @@
+import os
+from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
+
+
+class TBBConan(ConanFile):
+    name = "tbb"
+    license = "Apache-2.0"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/oneapi-src/oneTBB"
+    description = """oneAPI Threading Building Blocks (oneTBB) lets you easily write parallel C++
+programs that take full advantage of multicore performance, that are portable and composable, and
+that have future-proof scalability"""
+    topics = ("conan", "tbb", "onetbb", "threading", "parallelism", "tbbmalloc")
+    settings = "os", "compiler", "build_type", "arch"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "tbbmalloc": [True, False],
+        "tbbproxy": [True, False],
+        "ipo": [True, False]
+    }
+    default_options = {
+        "shared": True,
+        "fPIC": True,
+        "tbbmalloc": False,
+        "tbbproxy": False,
+        "ipo": False
+    }
+    exports_sources = ["CMakeLists.txt"]
+    generators = "cmake"
+
+    _cmake = None
+
+    @property
+    def _source_subfolder(self):
+        return "source_subfolder"
+
+    @property
+    def _build_subfolder(self):
+        return "build_subfolder"
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if "sha256" not in self.conan_data["sources"][self.version]:
+            raise ConanInvalidConfiguration("oneTBB {} sources have no sha256 in conandata.yml".format(self.version))
+        if self.settings.compiler.cppstd:
+            tools.check_min_cppstd(self, 11)
+        if self.options.shared:
+            del self.options.fPIC
+        else:
+            self.output.warn("oneTBB strongly discourages usage of static linkage")
+        if self.options.tbbproxy and \
+           (not self.options.shared or \
+            not self.options.tbbmalloc):
+            raise ConanInvalidConfiguration("tbbproxy needs tbbmaloc and shared options")
+
+    def source(self):
+        tools.get(**self.conan_data["sources"][self.version])
+        os.rename("oneTBB-{}".format(self.version), self._source_subfolder)
+
+    def _configure_cmake(self):
+        if self._cmake:
+            return self._cmake
+        self._cmake = CMake(self)
+        self._cmake.definitions["TBB_TEST"] = False
+        self._cmake.definitions["TBB_EXAMPLES"] = False
+        self._cmake.definitions["TBB_STRICT"] = False
+        self._cmake.definitions["TBB4PY_BUILD"] = False
+        self._cmake.definitions["TBBMALLOC_BUILD"] = self.options.tbbmalloc
+        self._cmake.definitions["TBBMALLOC_PROXY_BUILD"] = self.options.tbbproxy
+        self._cmake.definitions["TBB_ENABLE_IPO"] = self.options.ipo
+        # tbbbind needs hwloc, which is not available yet in CCI
+        self._cmake.definitions["TBB_DISABLE_HWLOC_AUTOMATIC_SEARCH"] = True
+        self._cmake.configure(build_folder=self._build_subfolder)
+        return self._cmake
+
+    def build(self):
+        cmake = self._configure_cmake()
+        cmake.build()
+
+    def package(self):
+        self.copy("LICENSE.txt", dst="licenses", src=self._source_subfolder)
+        cmake = self._configure_cmake()
+        cmake.install()
+        tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
+        tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        tools.rmdir(os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.names["cmake_find_package"] = "TBB"
+        self.cpp_info.names["cmake_find_package_multi"] = "TBB"
+        # tbb
+        self.cpp_info.components["libtbb"].names["cmake_find_package"] = "tbb"
+        self.cpp_info.components["libtbb"].names["cmake_find_package_multi"] = "tbb"
+        # the Windows import library carries the binary interface version
+        self.cpp_info.components["libtbb"].libs = [self._lib_name("tbb12" if self.settings.os == "Windows" else "tbb")]
+        if self.settings.os == "Linux":
+            self.cpp_info.components["libtbb"].system_libs = ["dl", "rt", "pthread"]
+        # tbbmalloc
+        if self.options.tbbmalloc:
+            self.cpp_info.components["tbbmalloc"].names["cmake_find_package"] = "tbbmalloc"
+            self.cpp_info.components["tbbmalloc"].names["cmake_find_package_multi"] = "tbbmalloc"
+            self.cpp_info.components["tbbmalloc"].libs = [self._lib_name("tbbmalloc")]
+            if self.settings.os == "Linux":
+                self.cpp_info.components["tbbmalloc"].system_libs = ["dl", "pthread"]
+            # tbbmalloc_proxy
+            if self.options.tbbproxy:
+                self.cpp_info.components["tbbmalloc_proxy"].names["cmake_find_package"] = "tbbmalloc_proxy"
+                self.cpp_info.components["tbbmalloc_proxy"].names["cmake_find_package_multi"] = "tbbmalloc_proxy"
+                self.cpp_info.components["tbbmalloc_proxy"].libs = [self._lib_name("tbbmalloc_proxy")]
+                self.cpp_info.components["tbbmalloc_proxy"].requires = ["tbbmalloc"]
+
+    def _lib_name(self, name):
+        if self.settings.build_type == "Debug":
+            return name + "_debug"
+        return name
@@ -0,0 +1,56 @@
+#include "tbb/task_group.h"
+#include "tbb/flow_graph.h"
+#include "tbb/info.h"
+#include "tbb/task_arena.h"
+#ifdef TBB_HAS_TBBMALLOC
+#include "tbb/scalable_allocator.h"
+#endif
+#include <iostream>
+#include <vector>
+
+using namespace tbb;
+using namespace tbb::flow;
+
+int Fib(int n) {
+    if( n<2 ) {
+        return n;
+    } else {
+        int x, y;
+        task_group g;
+        g.run([&]{x=Fib(n-1);}); // spawn a task
+        g.run([&]{y=Fib(n-2);}); // spawn another task
+        g.wait();                // wait for both tasks to complete
+        return x+y;
+    }
+}
+
+int main(){
+    std::cout<<"Fib 6="<<Fib(6)<<"\n";
+
+    graph g;
+    continue_node< continue_msg> hello( g,
+      []( const continue_msg &) {
+          std::cout << "Hello";
+      }
+    );
+    continue_node< continue_msg> world( g,
+      []( const continue_msg &) {
+          std::cout << " World\n";
+      }
+    );
+    make_edge(hello, world);
+    hello.try_put(continue_msg());
+    g.wait_for_all();
+
+    // Without tbbbind, a single NUMA node is reported
+    std::vector<numa_node_id> numa_nodes = info::numa_nodes();
+    std::cout << "NUMA nodes: " << numa_nodes.size() << "\n";
+    task_arena arena(task_arena::constraints(numa_nodes.front()));
+    std::cout << "Fib 10 in NUMA node " << numa_nodes.front() << " arena=" << arena.execute([]{ return Fib(10); }) << "\n";
+
+#ifdef TBB_HAS_TBBMALLOC
+    std::vector<int, scalable_allocator<int>> values(1000, 1);
+    std::cout << "scalable_allocator: " << values.size() << " values\n";
+#endif
+    return 0;
+}
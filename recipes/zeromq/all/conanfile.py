@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, tools, CMake
+from conans.errors import ConanInvalidConfiguration
 
 
 class ZeroMQConan(ConanFile):
@@ -15,11 +16,21 @@ class ZeroMQConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "encryption": [None, "libsodium", "tweetnacl"],
+        "with_draft_api": [True, False],
+        "with_radix_tree": [True, False],
+        "poller": [None, "kqueue", "epoll", "devpoll", "pollset", "poll", "select"],
+        "cacheline_size": "ANY",
+        "build_tools": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "encryption": "libsodium",
+        "with_draft_api": False,
+        "with_radix_tree": False,
+        "poller": None,
+        "cacheline_size": "",
+        "build_tools": False,
     }
     generators = "cmake", "cmake_find_package"
 
@@ -33,13 +44,35 @@ class ZeroMQConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    @property
+    def _perf_tools(self):
+        return ["local_lat", "remote_lat", "local_thr", "remote_thr", "inproc_lat", "inproc_thr"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if tools.Version(self.version) < "4.3.3":
+            del self.options.cacheline_size
 
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        poller_os = {
+            "kqueue": ["Macos", "iOS", "watchOS", "tvOS", "FreeBSD"],
+            "epoll": ["Linux", "Android"],
+            "devpoll": ["SunOS"],
+            "pollset": ["AIX"],
+        }
+        poller = str(self.options.poller)
+        if poller in poller_os and self.settings.os not in poller_os[poller]:
+            raise ConanInvalidConfiguration("{} poller is not available on {}".format(self.options.poller, self.settings.os))
+        if self.options.poller == "poll" and self.settings.os == "Windows":
+            raise ConanInvalidConfiguration("poll poller is not available on Windows")
+        cacheline_size = str(self.options.get_safe("cacheline_size", ""))
+        if cacheline_size and (not cacheline_size.isdigit() or int(cacheline_size) == 0 or int(cacheline_size) & (int(cacheline_size) - 1)):
+            raise ConanInvalidConfiguration("cacheline_size must be a power of two")
+        if self.options.build_tools and self.settings.build_type == "Debug":
+            raise ConanInvalidConfiguration("zeromq does not build its perf tools in Debug")
 
     def requirements(self):
         if self.options.encryption == "libsodium":
@@ -56,7 +89,13 @@ class ZeroMQConan(ConanFile):
         self._cmake.definitions["ENABLE_CURVE"] = bool(self.options.encryption)
         self._cmake.definitions["WITH_LIBSODIUM"] = self.options.encryption == "libsodium"
         self._cmake.definitions["ZMQ_BUILD_TESTS"] = False
-        self._cmake.definitions["WITH_PERF_TOOL"] = False
+        self._cmake.definitions["WITH_PERF_TOOL"] = self.options.build_tools
+        self._cmake.definitions["ENABLE_DRAFTS"] = self.options.with_draft_api
+        self._cmake.definitions["ENABLE_RADIX_TREE"] = self.options.with_radix_tree
+        if self.options.poller:
+            self._cmake.definitions["POLLER"] = self.options.poller
+        if self.options.get_safe("cacheline_size"):
+            self._cmake.definitions["ZMQ_CACHELINE_SIZE"] = self.options.cacheline_size
         self._cmake.definitions["BUILD_SHARED"] = self.options.shared
         self._cmake.definitions["BUILD_STATIC"] = not self.options.shared
         self._cmake.definitions["BUILD_TESTS"] = False
@@ -92,6 +131,10 @@ class ZeroMQConan(ConanFile):
         self.copy(pattern="COPYING*", src=self._source_subfolder, dst="licenses")
         cmake = self._configure_cmake()
         cmake.install()
+        if self.options.build_tools:
+            for perf_tool in self._perf_tools:
+                self.copy(perf_tool, src=os.path.join(self._build_subfolder, "bin"), dst="bin", keep_path=False)
+                self.copy("{}.exe".format(perf_tool), src=os.path.join(self._build_subfolder, "bin"), dst="bin", keep_path=False)
 
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "share"))
@@ -113,5 +156,12 @@ class ZeroMQConan(ConanFile):
             self.cpp_info.components["libzmq"].system_libs = ["pthread", "rt", "m"]
         if not self.options.shared:
             self.cpp_info.components["libzmq"].defines.append("ZMQ_STATIC")
+        if self.options.with_draft_api:
+            self.cpp_info.components["libzmq"].defines.append("ZMQ_BUILD_DRAFT_API")
         if self.options.encryption == "libsodium":
             self.cpp_info.components["libzmq"].requires = ["libsodium::libsodium"]
+
+        if self.options.build_tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH env var with : {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
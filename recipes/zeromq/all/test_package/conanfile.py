@@ -17,3 +17,6 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["zeromq"].build_tools:
+                self.run("inproc_lat 64 10000", run_environment=True)
+                self.run("inproc_thr 64 100000", run_environment=True)
@@ -1,10 +1,125 @@
 #include <zmq.h>
+#include <chrono>
+#include <cstdint>
 #include <cstdlib>
+#include <cstring>
 #include <iostream>
 #include <stdexcept>
+#include <string>
+#include <thread>
+
+static const int message_size = 64;
+
+static void check(int rc, const char *what)
+{
+    if (rc == -1)
+        throw std::runtime_error(std::string(what) + " failed: " + zmq_strerror(zmq_errno()));
+}
+
+// Binds a socket and returns the resolved endpoint, so that "tcp://127.0.0.1:*" picks a free port
+static std::string bind_endpoint(void *socket, const char *endpoint)
+{
+    char last_endpoint[256];
+    size_t size = sizeof(last_endpoint);
+    check(zmq_bind(socket, endpoint), "zmq_bind");
+    check(zmq_getsockopt(socket, ZMQ_LAST_ENDPOINT, last_endpoint, &size), "zmq_getsockopt");
+    return last_endpoint;
+}
+
+static void measure_latency(void *context, const char *endpoint, int roundtrips)
+{
+    void *rep = zmq_socket(context, ZMQ_REP);
+    void *req = zmq_socket(context, ZMQ_REQ);
+    const std::string address = bind_endpoint(rep, endpoint);
+    check(zmq_connect(req, address.c_str()), "zmq_connect");
+
+    std::thread echo([rep, roundtrips]() {
+        char buffer[message_size];
+        for (int i = 0; i < roundtrips; ++i) {
+            zmq_recv(rep, buffer, sizeof(buffer), 0);
+            zmq_send(rep, buffer, sizeof(buffer), 0);
+        }
+    });
+
+    char buffer[message_size];
+    std::memset(buffer, 0, sizeof(buffer));
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < roundtrips; ++i) {
+        check(zmq_send(req, buffer, sizeof(buffer), 0), "zmq_send");
+        check(zmq_recv(req, buffer, sizeof(buffer), 0), "zmq_recv");
+    }
+    const std::chrono::duration<double, std::micro> elapsed = std::chrono::steady_clock::now() - start;
+    echo.join();
+
+    std::cout << address << " latency: " << elapsed.count() / roundtrips / 2 << " us" << std::endl;
+    zmq_close(req);
+    zmq_close(rep);
+}
+
+static void measure_throughput(void *context, const char *endpoint, int message_count)
+{
+    void *pull = zmq_socket(context, ZMQ_PULL);
+    void *push = zmq_socket(context, ZMQ_PUSH);
+    const std::string address = bind_endpoint(pull, endpoint);
+    check(zmq_connect(push, address.c_str()), "zmq_connect");
+
+    std::thread sender([push, message_count]() {
+        char buffer[message_size];
+        std::memset(buffer, 0, sizeof(buffer));
+        for (int i = 0; i < message_count; ++i)
+            zmq_send(push, buffer, sizeof(buffer), 0);
+    });
+
+    char buffer[message_size];
+    check(zmq_recv(pull, buffer, sizeof(buffer), 0), "zmq_recv");
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 1; i < message_count; ++i)
+        check(zmq_recv(pull, buffer, sizeof(buffer), 0), "zmq_recv");
+    const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    sender.join();
+
+    std::cout << address << " throughput: " << static_cast<long>((message_count - 1) / elapsed.count()) << " msg/s" << std::endl;
+    zmq_close(push);
+    zmq_close(pull);
+}
+
+#if defined(ZMQ_BUILD_DRAFT_API)
+static void check_client_server(void *context)
+{
+    void *server = zmq_socket(context, ZMQ_SERVER);
+    void *client = zmq_socket(context, ZMQ_CLIENT);
+    check(zmq_bind(server, "inproc://client-server"), "zmq_bind");
+    check(zmq_connect(client, "inproc://client-server"), "zmq_connect");
+
+    check(zmq_send(client, "ping", 4, 0), "zmq_send");
+    zmq_msg_t message;
+    zmq_msg_init(&message);
+    check(zmq_msg_recv(&message, server, 0), "zmq_msg_recv");
+    const uint32_t routing_id = zmq_msg_routing_id(&message);
+    zmq_msg_close(&message);
+
+    zmq_msg_init_size(&message, 4);
+    std::memcpy(zmq_msg_data(&message), "pong", 4);
+    check(zmq_msg_set_routing_id(&message, routing_id), "zmq_msg_set_routing_id");
+    check(zmq_msg_send(&message, server, 0), "zmq_msg_send");
+
+    char buffer[4];
+    check(zmq_recv(client, buffer, sizeof(buffer), 0), "zmq_recv");
+    if (std::memcmp(buffer, "pong", 4) != 0)
+        throw std::runtime_error("unexpected ZMQ_SERVER reply");
+    std::cout << "ZMQ_CLIENT/ZMQ_SERVER draft sockets: ok" << std::endl;
+
+    zmq_close(client);
+    zmq_close(server);
+}
+#endif
 
 int main() try
 {
+    int major, minor, patch;
+    zmq_version(&major, &minor, &patch);
+    std::cout << "ZeroMQ version: " << major << "." << minor << "." << patch << std::endl;
+
     void *context = zmq_ctx_new();
     void *requester = zmq_socket(context, ZMQ_REQ);
 #if defined(WITH_LIBSODIUM)
@@ -13,6 +128,15 @@ int main() try
         throw std::runtime_error("zmq_setsockopt with ZMQ_CURVE_SERVER failed");
 #endif
     zmq_close(requester);
+
+    measure_latency(context, "inproc://latency", 10000);
+    measure_throughput(context, "inproc://throughput", 100000);
+    measure_latency(context, "tcp://127.0.0.1:*", 10000);
+    measure_throughput(context, "tcp://127.0.0.1:*", 100000);
+#if defined(ZMQ_BUILD_DRAFT_API)
+    check_client_server(context);
+#endif
+
     zmq_ctx_destroy (context);
 
     return EXIT_SUCCESS;
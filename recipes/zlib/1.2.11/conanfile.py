@@ -1,7 +1,7 @@
 import os
 import stat
 from conans import ConanFile, tools, CMake, AutoToolsBuildEnvironment
-from conans.errors import ConanException
+from conans.errors import ConanException, ConanInvalidConfiguration
 
 
 class ZlibConan(ConanFile):
@@ -13,11 +13,13 @@ class ZlibConan(ConanFile):
     description = ("A Massively Spiffy Yet Delicately Unobtrusive Compression Library "
                    "(Also Free, Not to Mention Unencumbered by Patents)")
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False], "minizip": [True, False]}
-    default_options = {"shared": False, "fPIC": True, "minizip": False}
+    options = {"shared": [True, False], "fPIC": [True, False], "minizip": [True, False], "implementation": ["zlib", "zlib-ng"]}
+    default_options = {"shared": False, "fPIC": True, "minizip": False, "implementation": "zlib"}
     exports_sources = ["CMakeLists.txt", "CMakeLists_minizip.txt", "patches/**"]
     generators = "cmake"
     _source_subfolder = "source_subfolder"
+    _zlib_ng_source_subfolder = "zlib-ng_source_subfolder"
+    _zlib_ng_build_subfolder = "zlib-ng_build_subfolder"
     topics = ("conan", "zlib", "compression")
 
     def config_options(self):
@@ -27,10 +29,14 @@ class ZlibConan(ConanFile):
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.options.implementation == "zlib-ng":
+            if self.options.minizip:
+                raise ConanInvalidConfiguration("minizip is not available with the zlib-ng implementation")
+            if "sha256" not in self.conan_data["sources"][self.version]["zlib-ng"]:
+                raise ConanInvalidConfiguration("zlib-ng {} sources have no sha256 in conandata.yml".format(self._zlib_ng_version))
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
-
+        tools.get(**self.conan_data["sources"][self.version]["zlib"])
         os.rename("{}-{}".format(self.name, self.version), self._source_subfolder)
         if not tools.os_info.is_windows:
             configure_file = os.path.join(self._source_subfolder, "configure")
@@ -38,10 +44,37 @@ class ZlibConan(ConanFile):
             os.chmod(configure_file, st.st_mode | stat.S_IEXEC)
 
     def build(self):
+        if self.options.implementation == "zlib-ng":
+            self._build_zlib_ng()
+            return
         self._build_zlib()
         if self.options.minizip:
             self._build_minizip()
 
+    @property
+    def _zlib_ng_version(self):
+        url = self.conan_data["sources"][self.version]["zlib-ng"]["url"]
+        return os.path.basename(url)[:-len(".tar.gz")]
+
+    def _configure_zlib_ng_cmake(self):
+        cmake = CMake(self)
+        # Drop-in replacement of zlib: same API, headers and library names
+        cmake.definitions["ZLIB_COMPAT"] = True
+        cmake.definitions["ZLIB_ENABLE_TESTS"] = False
+        cmake.definitions["WITH_GZFILEOP"] = True
+        # Optimized (SIMD) code paths, selected at runtime according to the cpu features
+        cmake.definitions["WITH_OPTIM"] = True
+        cmake.definitions["WITH_NATIVE_INSTRUCTIONS"] = False
+        cmake.configure(source_folder=self._zlib_ng_source_subfolder, build_folder=self._zlib_ng_build_subfolder)
+        return cmake
+
+    def _build_zlib_ng(self):
+        # source() cannot depend on options: only fetch zlib-ng when it is actually built
+        tools.get(**self.conan_data["sources"][self.version]["zlib-ng"])
+        os.rename("zlib-ng-{}".format(self._zlib_ng_version), self._zlib_ng_source_subfolder)
+        cmake = self._configure_zlib_ng_cmake()
+        cmake.build()
+
     @property
     def _use_autotools(self):
         if str(self.settings.os) in ["iOS", "watchOS", "tvOS"]:
@@ -142,7 +175,36 @@ class ZlibConan(ConanFile):
                     current_lib = os.path.join(lib_path, "zlibstatic.lib")
                     os.rename(current_lib, os.path.join(lib_path, "zlib.lib"))
 
+    def _rename_zlib_ng_libraries(self):
+        # zlib-ng does not use stock zlib output names on Windows (zlibstatic, "d" postfix in Debug,
+        # libz with MinGW): rename the static or import library to the one declared in package_info
+        if self.settings.os != "Windows" or self.settings.os.subsystem:
+            return
+        lib_path = os.path.join(self.package_folder, "lib")
+        if self.settings.compiler in ["Visual Studio", "clang"]:
+            prefix, extension = "", ".lib"
+        else:
+            prefix, extension = "lib", ".dll.a" if self.options.shared else ".a"
+        for name in ["zlibstatic", "zlibstaticd", "zlibd", "z", "zd"]:
+            current_lib = os.path.join(lib_path, prefix + name + extension)
+            if os.path.isfile(current_lib):
+                os.rename(current_lib, os.path.join(lib_path, prefix + "zlib" + extension))
+                break
+
+    def _package_zlib_ng(self):
+        tools.save(os.path.join(self.package_folder, "licenses", "LICENSE"),
+                   tools.load(os.path.join(self._zlib_ng_source_subfolder, "LICENSE.md")))
+        cmake = self._configure_zlib_ng_cmake()
+        cmake.install()
+        tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        tools.rmdir(os.path.join(self.package_folder, "share"))
+        self._rename_zlib_ng_libraries()
+
     def package(self):
+        if self.options.implementation == "zlib-ng":
+            self._package_zlib_ng()
+            return
+
         # Extract the License/s from the header to a file
         with tools.chdir(os.path.join(self.source_folder, self._source_subfolder)):
             tmp = tools.load("zlib.h")
@@ -19,5 +19,6 @@ class TestZlibConan(ConanFile):
         assert os.path.exists(os.path.join(self.build_folder, "zlib.pc"))
         if "x86" in self.settings.arch and not tools.cross_building(self.settings):
             self.run(os.path.join("bin", "test"), run_environment=True)
+            self.run(os.path.join("bin", "test_throughput"), run_environment=True)
             if self.options["zlib"].minizip:
                 self.run(os.path.join("bin", "test_minizip"), run_environment=True)
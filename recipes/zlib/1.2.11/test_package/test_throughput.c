@@ -0,0 +1,82 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include <zlib.h>
+
+#define CORPUS_SIZE (1024 * 1024)
+
+/* Deterministic, moderately compressible corpus: words picked by a LCG */
+static void fill_corpus(unsigned char *buffer, size_t size) {
+    static const char *words[] = {"conan ", "package ", "manager ", "zlib ", "deflate ", "inflate ", "0123 ", "\n"};
+    unsigned long state = 12345;
+    size_t pos = 0;
+    while (pos < size) {
+        const char *word;
+        size_t len;
+        state = state * 1103515245UL + 12345UL;
+        word = words[(state >> 16) % (sizeof(words) / sizeof(words[0]))];
+        len = strlen(word);
+        if (len > size - pos) {
+            len = size - pos;
+        }
+        memcpy(buffer + pos, word, len);
+        pos += len;
+    }
+}
+
+static double elapsed_seconds(clock_t start) {
+    return (double)(clock() - start) / CLOCKS_PER_SEC;
+}
+
+static double mb_per_s(size_t bytes, double seconds) {
+    return seconds > 0. ? (double)bytes / (1024. * 1024.) / seconds : 0.;
+}
+
+int main(void) {
+    static const int levels[] = {1, 6, 9};
+    unsigned char *corpus = malloc(CORPUS_SIZE);
+    unsigned char *decompressed = malloc(CORPUS_SIZE);
+    uLong compressed_capacity = compressBound(CORPUS_SIZE);
+    unsigned char *compressed = malloc(compressed_capacity);
+    size_t i;
+
+    if (corpus == NULL || decompressed == NULL || compressed == NULL) {
+        fprintf(stderr, "out of memory\n");
+        return EXIT_FAILURE;
+    }
+    fill_corpus(corpus, CORPUS_SIZE);
+
+    printf("zlib version: %s\n", zlibVersion());
+    for (i = 0; i < sizeof(levels) / sizeof(levels[0]); ++i) {
+        uLongf compressed_size = compressed_capacity;
+        uLongf decompressed_size = CORPUS_SIZE;
+        double compress_time;
+        double decompress_time;
+        clock_t start;
+
+        start = clock();
+        if (compress2(compressed, &compressed_size, corpus, CORPUS_SIZE, levels[i]) != Z_OK) {
+            fprintf(stderr, "compress2 failed at level %d\n", levels[i]);
+            return EXIT_FAILURE;
+        }
+        compress_time = elapsed_seconds(start);
+
+        start = clock();
+        if (uncompress(decompressed, &decompressed_size, compressed, compressed_size) != Z_OK
+                || decompressed_size != CORPUS_SIZE || memcmp(corpus, decompressed, CORPUS_SIZE) != 0) {
+            fprintf(stderr, "round-trip failed at level %d\n", levels[i]);
+            return EXIT_FAILURE;
+        }
+        decompress_time = elapsed_seconds(start);
+
+        printf("level %d: ratio %.2f, compress %.1f MB/s, decompress %.1f MB/s\n", levels[i],
+               (double)CORPUS_SIZE / compressed_size, mb_per_s(CORPUS_SIZE, compress_time), mb_per_s(CORPUS_SIZE, decompress_time));
+    }
+
+    free(corpus);
+    free(decompressed);
+    free(compressed);
+    return EXIT_SUCCESS;
+}
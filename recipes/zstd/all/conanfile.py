@@ -12,8 +12,22 @@ class ZstdConan(ConanFile):
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "threading": [True, False],
+        "legacy_support": [True, False],
+        "legacy_level": [1, 2, 3, 4, 5, 6, 7],
+        "build_programs": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "threading": True,
+        "legacy_support": False,
+        "legacy_level": 5,
+        "build_programs": False,
+    }
 
     _cmake = None
 
@@ -32,6 +46,8 @@ class ZstdConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if not self.options.legacy_support:
+            del self.options.legacy_level
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
 
@@ -44,9 +60,14 @@ class ZstdConan(ConanFile):
         if self._cmake:
             return self._cmake
         self._cmake = CMake(self)
-        self._cmake.definitions["ZSTD_BUILD_PROGRAMS"] = False
-        self._cmake.definitions["ZSTD_BUILD_STATIC"] = not self.options.shared
+        self._cmake.definitions["ZSTD_BUILD_PROGRAMS"] = self.options.build_programs
+        # The zstd programs are always linked to the static library
+        self._cmake.definitions["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         self._cmake.definitions["ZSTD_BUILD_SHARED"] = self.options.shared
+        self._cmake.definitions["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        self._cmake.definitions["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support
+        if self.options.legacy_support:
+            self._cmake.definitions["ZSTD_LEGACY_LEVEL"] = self.options.legacy_level
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -57,6 +78,10 @@ class ZstdConan(ConanFile):
         if tools.Version(self.version) >= "1.4.5":
             tools.replace_in_file(os.path.join(self._source_subfolder, "build", "cmake", "lib", "CMakeLists.txt"),
                                   "POSITION_INDEPENDENT_CODE On", "")
+        # Older versions hardcode the legacy level
+        if self.options.legacy_support:
+            tools.replace_in_file(os.path.join(self._source_subfolder, "build", "cmake", "CMakeLists.txt"),
+                                  "-DZSTD_LEGACY_SUPPORT=5", "-DZSTD_LEGACY_SUPPORT={}".format(self.options.legacy_level), strict=False)
 
     def build(self):
         self._patch_sources()
@@ -69,6 +94,13 @@ class ZstdConan(ConanFile):
         cmake.install()
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        if self.options.shared and self.options.build_programs:
+            # The static library is only built for the programs. Remove it by name, as
+            # MinGW also installs the libzstd.dll.a import library next to it
+            for static_lib in ["libzstd.a", "zstd_static.lib"]:
+                static_lib_path = os.path.join(self.package_folder, "lib", static_lib)
+                if os.path.isfile(static_lib_path):
+                    os.remove(static_lib_path)
 
     def package_info(self):
         zstd_cmake = "libzstd_shared" if self.options.shared else "libzstd_static"
@@ -76,5 +108,10 @@ class ZstdConan(ConanFile):
         self.cpp_info.components["zstdlib"].names["cmake_find_package"] = zstd_cmake
         self.cpp_info.components["zstdlib"].names["cmake_find_package_multi"] = zstd_cmake
         self.cpp_info.components["zstdlib"].libs = tools.collect_libs(self)
-        if self.settings.os in ["Linux", "FreeBSD"]:
+        if self.options.threading and self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["zstdlib"].system_libs.append("pthread")
+
+        if self.options.build_programs:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
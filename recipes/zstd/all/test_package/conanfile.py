@@ -9,6 +9,7 @@ class TestPackageConan(ConanFile):
     def build(self):
         cmake = CMake(self)
         cmake.definitions["ZSTD_SHARED"] = self.options["zstd"].shared
+        cmake.definitions["ZSTD_THREADING"] = self.options["zstd"].threading
         cmake.configure()
         cmake.build()
 
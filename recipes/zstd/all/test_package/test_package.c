@@ -111,6 +111,40 @@ static const char* createOutFilename_orDie(const char* filename)
     return (const char*)outSpace;
 }
 
+#if ZSTD_VERSION_NUMBER >= 10400
+static void compress2RoundTrip_orDie(const char* fname, int nbWorkers)
+{
+    FILE* const fin = fopen_orDie(fname, "rb");
+    fseek(fin, 0, SEEK_END);
+    size_t const srcSize = (size_t)ftell(fin);
+    fseek(fin, 0, SEEK_SET);
+    void* const src = malloc_orDie(srcSize);
+    fread_orDie(src, srcSize, fin);
+    fclose_orDie(fin);
+
+    size_t const dstCapacity = ZSTD_compressBound(srcSize);
+    void* const dst = malloc_orDie(dstCapacity);
+    void* const decompressed = malloc_orDie(srcSize);
+
+    ZSTD_CCtx* const cctx = ZSTD_createCCtx();
+    if (cctx==NULL) { fprintf(stderr, "ZSTD_createCCtx() error \n"); exit(20); }
+    size_t const setResult = ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, nbWorkers);
+    if (ZSTD_isError(setResult)) { fprintf(stderr, "ZSTD_CCtx_setParameter(ZSTD_c_nbWorkers, %d) error : %s \n", nbWorkers, ZSTD_getErrorName(setResult)); exit(21); }
+    size_t const cSize = ZSTD_compress2(cctx, dst, dstCapacity, src, srcSize);
+    if (ZSTD_isError(cSize)) { fprintf(stderr, "ZSTD_compress2() error : %s \n", ZSTD_getErrorName(cSize)); exit(22); }
+
+    size_t const dSize = ZSTD_decompress(decompressed, srcSize, dst, cSize);
+    if (ZSTD_isError(dSize)) { fprintf(stderr, "ZSTD_decompress() error : %s \n", ZSTD_getErrorName(dSize)); exit(23); }
+    if (dSize != srcSize || memcmp(src, decompressed, srcSize) != 0) { fprintf(stderr, "round-trip mismatch \n"); exit(24); }
+    printf("ZSTD_compress2 round-trip with %d workers: %u -> %u bytes\n", nbWorkers, (unsigned)srcSize, (unsigned)cSize);
+
+    ZSTD_freeCCtx(cctx);
+    free(src);
+    free(dst);
+    free(decompressed);
+}
+#endif
+
 int main(int argc, const char** argv)
 {
     const char* const inFilename = "logo.png";
@@ -118,5 +152,13 @@ int main(int argc, const char** argv)
     const char* const outFilename = createOutFilename_orDie(inFilename);
     compressFile_orDie(inFilename, outFilename, 1);
 
+#if ZSTD_VERSION_NUMBER >= 10400
+#ifdef ZSTD_THREADING
+    compress2RoundTrip_orDie(inFilename, 2);
+#else
+    compress2RoundTrip_orDie(inFilename, 0);
+#endif
+#endif
+
     return 0;
 }